@@ -5,6 +5,7 @@ Configuration management for macOS EFIS Data Manager daemon.
 import os
 import yaml
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
@@ -35,6 +36,29 @@ class MacOSConfig:
     pid_file: str = "/tmp/efis-macos-daemon.pid"
 
 
+@lru_cache(maxsize=1)
+def find_default_config_path() -> str:
+    """
+    Locate the daemon configuration file, probing the search path only once.
+    
+    Call find_default_config_path.cache_clear() after creating or removing a
+    configuration file to pick up the change in a running process.
+    """
+    # Try multiple locations in order of preference
+    possible_paths = [
+        os.path.expanduser("~/.config/efis-data-manager/macos-config.yaml"),
+        os.path.join(os.path.dirname(__file__), "..", "..", "config", "macos-config.yaml"),
+        "/etc/efis-data-manager/macos-config.yaml"
+    ]
+    
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path
+    
+    # Return the first path as default (will be created if needed)
+    return possible_paths[0]
+
+
 class ConfigManager:
     """Manages configuration loading and validation."""
     
@@ -45,19 +69,7 @@ class ConfigManager:
     
     def _get_default_config_path(self) -> str:
         """Get the default configuration file path."""
-        # Try multiple locations in order of preference
-        possible_paths = [
-            os.path.expanduser("~/.config/efis-data-manager/macos-config.yaml"),
-            os.path.join(os.path.dirname(__file__), "..", "..", "config", "macos-config.yaml"),
-            "/etc/efis-data-manager/macos-config.yaml"
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        
-        # Return the first path as default (will be created if needed)
-        return possible_paths[0]
+        return find_default_config_path()
     
     def load_config(self) -> MacOSConfig:
         """Load configuration from file or create default."""
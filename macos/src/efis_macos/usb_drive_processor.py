@@ -631,6 +631,8 @@ class SafeDriveAccess:
 class USBDriveProcessor:
     """Main USB drive processing coordinator."""
     
+    MAX_LOGGED_ERRORS = 100  # Errors included in a failed-processing log record
+    
     def __init__(self, config: MacOSConfig):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -726,7 +728,11 @@ class USBDriveProcessor:
                 if result.success:
                     self.logger.info(f"Successfully processed USB drive: {drive_info['mount_path']}")
                 else:
-                    self.logger.warning(f"Failed to process USB drive: {', '.join(result.errors)}")
+                    errors = result.errors
+                    self.logger.warning(
+                        f"Failed to process USB drive ({len(errors)} errors): "
+                        f"{', '.join(errors[:self.MAX_LOGGED_ERRORS])}"
+                    )
             except Exception as e:
                 self.logger.error(f"Error in drive callback: {e}")
         
@@ -34,6 +34,7 @@ common_requirements = [
 dev_requirements = [
     "pytest>=7.0.0",
     "pytest-cov>=4.0.0",
+    "pytest-xdist>=3.0.0",
     "black>=22.0.0",
     "flake8>=5.0.0",
     "mypy>=0.991",
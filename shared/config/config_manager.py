@@ -13,6 +13,7 @@ import keyring
 from typing import Dict, Any, Optional, List, Union
 from pathlib import Path
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from cryptography.fernet import Fernet
 import base64
 import hashlib
@@ -20,6 +21,15 @@ import hashlib
 from .validation import ConfigSchema
 
 
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple:
+    """Split a dot-notation configuration key into its parts."""
+    return tuple(key.split('.'))
+
+
 @dataclass
 class WindowsConfig:
     """Windows system configuration."""
@@ -251,8 +261,7 @@ class ConfigManager:
             self._create_default_config(config_path)
             
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self._raw_config = yaml.safe_load(f) or {}
+            self._raw_config = self._read_config_file(config_path)
                 
             # Handle environment-specific overrides
             self._apply_environment_overrides()
@@ -280,6 +289,71 @@ class ConfigManager:
             self.logger.error(f"Error loading config file {config_path}: {e}")
             raise
             
+    def _read_config_file(self, config_path: Path) -> Dict[str, Any]:
+        """
+        Read the raw configuration dictionary from a YAML file.
+        
+        The parsed file is cached as JSON in .cache/<name>.json next to it,
+        keyed by the file's mtime and size, so later runs skip YAML parsing
+        while the file is unchanged. The cache is plain data, and it is only
+        trusted when owned by the current user and not writable by others.
+        Only file contents are cached; overrides and credentials are applied
+        afterwards.
+        """
+        stat = config_path.stat()
+        key = [stat.st_mtime_ns, stat.st_size]
+        cache_path = config_path.parent / '.cache' / f"{config_path.name}.json"
+        
+        cached_config = self._load_config_cache(cache_path, key)
+        if cached_config is not None:
+            return cached_config
+        
+        # Parse from one in-memory buffer rather than streaming the file
+        raw_config = yaml.load(config_path.read_bytes(), Loader=_YAML_LOADER) or {}
+        
+        try:
+            payload = json.dumps({'key': key, 'config': raw_config})
+        except (TypeError, ValueError):
+            return raw_config  # Values JSON cannot hold; parse every time
+        if json.loads(payload)['config'] != raw_config:
+            return raw_config  # JSON would not round-trip these values exactly
+        
+        # Create the cache owner-only regardless of the umask, and swap it in
+        # whole so a concurrent reader never sees a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.debug(f"Could not write config cache {cache_path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        
+        return raw_config
+    
+    def _load_config_cache(self, cache_path: Path, key: list) -> Optional[Dict[str, Any]]:
+        """Return the cached config if it is trustworthy and current, else None."""
+        try:
+            cache_stat = cache_path.stat()
+            if hasattr(os, 'getuid') and (
+                cache_stat.st_uid != os.getuid() or cache_stat.st_mode & 0o022
+            ):
+                self.logger.warning(f"Ignoring config cache with unsafe ownership: {cache_path}")
+                return None
+            
+            cached = json.loads(cache_path.read_bytes())
+            if cached.get('key') == key and isinstance(cached.get('config'), dict):
+                return cached['config']
+        except (OSError, ValueError, AttributeError):
+            pass  # Missing, stale or unreadable cache; parse the file
+        
+        return None
+            
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value by key with support for structured config.
@@ -293,16 +367,15 @@ class ConfigManager:
         """
         if self._config is None:
             return default
-            
-        keys = key.split('.')
-        value = asdict(self._config) if hasattr(self._config, '__dict__') else self._raw_config
         
+        value = asdict(self._config) if hasattr(self._config, '__dict__') else self._raw_config
         try:
-            for k in keys:
+            for k in _split_key(key):
                 value = value[k]
-            return value
         except (KeyError, TypeError, AttributeError):
             return default
+        
+        return value
             
     def set(self, key: str, value: Any) -> None:
         """
@@ -312,7 +385,7 @@ class ConfigManager:
             key: Configuration key (supports dot notation)
             value: Value to set
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self._raw_config
         
         # Navigate to parent of target key
@@ -349,6 +349,18 @@ class ConfigSchema:
         }
     }
     
+    SCHEMAS = {
+        "windows": WINDOWS_SCHEMA,
+        "macos": MACOS_SCHEMA,
+        "grtUrls": GRT_URLS_SCHEMA
+    }
+    
+    # Required field names per section, precomputed for set-difference checks
+    REQUIRED_FIELDS = {
+        section: frozenset(name for name, field in schema.items() if field["required"])
+        for section, schema in SCHEMAS.items()
+    }
+    
     @classmethod
     def validate_section(cls, section_name: str, config_data: Dict[str, Any]) -> List[str]:
         """
@@ -361,24 +373,21 @@ class ConfigSchema:
         Returns:
             List of validation errors (empty if valid)
         """
-        schema_map = {
-            "windows": cls.WINDOWS_SCHEMA,
-            "macos": cls.MACOS_SCHEMA,
-            "grtUrls": cls.GRT_URLS_SCHEMA
-        }
-        
-        schema = schema_map.get(section_name)
+        schema = cls.SCHEMAS.get(section_name)
         if not schema:
             return [f"Unknown configuration section: {section_name}"]
         
         errors = []
         
-        # Check required fields
+        # Check required fields in one pass, reporting them in schema order
+        missing = cls.REQUIRED_FIELDS[section_name] - config_data.keys()
+        if missing:
+            errors.extend(
+                f"Missing required field in {section_name}: {field_name}"
+                for field_name in schema if field_name in missing
+            )
+        
         for field_name, field_config in schema.items():
-            if field_config["required"] and field_name not in config_data:
-                errors.append(f"Missing required field in {section_name}: {field_name}")
-                continue
-            
             if field_name in config_data:
                 field_value = config_data[field_name]
                 validator = field_config["validator"]
@@ -390,4 +399,4 @@ class ConfigSchema:
                 except Exception as e:
                     errors.append(f"{section_name}.{field_name}: Validation error - {e}")
         
-        return errors
\ No newline at end of file
+        return errors
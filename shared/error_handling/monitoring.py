@@ -2,8 +2,10 @@
 Comprehensive logging and monitoring for EFIS Data Manager.
 """
 
+import re
 import json
 import time
+import atexit
 import logging
 import logging.handlers
 import threading
@@ -14,7 +16,14 @@ from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 
 class LogLevel(Enum):
@@ -74,6 +83,21 @@ class HealthCheckResult:
         }
 
 
+# Log rotation sizes such as "50MB" or "512 kb"
+_SIZE_RE = re.compile(r'^(\d+)\s*([KMG]B)?$', re.IGNORECASE)
+_SIZE_MULTIPLIERS = {'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+# Standard LogRecord attributes; anything else on a record came from extra=
+_RESERVED_RECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created', 'msecs',
+    'relativeCreated', 'thread', 'threadName', 'processName',
+    'process', 'taskName', 'getMessage', 'exc_info', 'exc_text',
+    'stack_info', 'message', 'asctime'
+})
+
+
 class JSONStructuredFormatter(logging.Formatter):
     """
     JSON formatter for structured logging with enhanced metadata.
@@ -88,6 +112,14 @@ class JSONStructuredFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
+        log_entry = self.build_entry(record)
+        
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(log_entry, default=str, separators=(',', ':'))
+    
+    def build_entry(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """Build the structured log entry for a record."""
         # Base log entry
         log_entry = {
             'timestamp': datetime.fromtimestamp(record.created).isoformat(),
@@ -116,21 +148,72 @@ class JSONStructuredFormatter(logging.Formatter):
                 'traceback': self.formatException(record.exc_info)
             }
         
-        # Add extra fields from log record
-        extra_fields = {}
-        for key, value in record.__dict__.items():
-            if key not in {
-                'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                'filename', 'module', 'lineno', 'funcName', 'created', 'msecs',
-                'relativeCreated', 'thread', 'threadName', 'processName',
-                'process', 'getMessage', 'exc_info', 'exc_text', 'stack_info'
-            }:
-                extra_fields[key] = value
-        
-        if extra_fields:
-            log_entry['extra'] = extra_fields
+        # Add extra fields from log record; most records have none, which a
+        # single set difference detects
+        extra_keys = record.__dict__.keys() - _RESERVED_RECORD_ATTRS
+        if extra_keys:
+            log_entry['extra'] = {
+                key: value for key, value in record.__dict__.items() if key in extra_keys
+            }
         
-        return json.dumps(log_entry, default=str, separators=(',', ':'))
+        return log_entry
+
+
+class JSONBytesRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes orjson-encoded records as bytes.
+    
+    Records are serialized once, straight to UTF-8 bytes, skipping the str
+    round trip of Formatter.format and the encode in StreamHandler.emit. The
+    rollover check uses the encoded length instead of formatting twice.
+    Requires orjson and a JSONStructuredFormatter.
+    """
+    
+    def _open(self):
+        """Open the log file for binary appends."""
+        return open(self.baseFilename, 'ab')
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write one JSON line for the record, rotating first if it would not fit."""
+        try:
+            data = orjson.dumps(
+                self.formatter.build_entry(record),
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+            )
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(data)
+            self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    Memory handler that also flushes once its buffer has been held too long.
+    
+    Besides the usual capacity and level triggers, the buffer is written out
+    by the first record logged flush_interval seconds or more after the
+    oldest buffered one, so a quiet process never keeps records back for
+    longer than that plus the gap until its next record.
+    """
+    
+    def __init__(self, capacity: int, flush_interval: float, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.flush_interval = flush_interval
+        self._buffer_started = 0.0
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Flush when full, on a flush-level record, or once the buffer is stale."""
+        now = time.monotonic()
+        if len(self.buffer) == 1:
+            self._buffer_started = now  # First record since the last flush
+        return super().shouldFlush(record) or now - self._buffer_started >= self.flush_interval
 
 
 class StructuredLogger:
@@ -138,6 +221,9 @@ class StructuredLogger:
     Enhanced structured logger with JSON format and log rotation.
     """
     
+    DEFAULT_BUFFER_SIZE = 1024  # Records held before writing to the log file
+    DEFAULT_FLUSH_INTERVAL = 5.0  # Seconds a buffered record may wait for a write
+    
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         """
         Initialize structured logger.
@@ -157,7 +243,15 @@ class StructuredLogger:
         
     def _setup_logger(self) -> None:
         """Set up logger with handlers and formatters."""
-        # Clear existing handlers
+        # Clear existing handlers, flushing anything still buffered
+        for handler in self.logger.handlers:
+            # MemoryHandler.close() drops its target, so grab it first
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if isinstance(handler, logging.handlers.MemoryHandler):
+                atexit.unregister(handler.close)  # Avoid duplicates on re-setup
+                if target:
+                    target.close()
         self.logger.handlers.clear()
         
         # Set log level
@@ -182,14 +276,42 @@ class StructuredLogger:
         max_bytes = self._parse_size(self.config.get('max_size', '50MB'))
         backup_count = self.config.get('backup_count', 10)
         
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding='utf-8'
-        )
+        # The log file is opened on the first emitted record, so loggers
+        # that never write cost no file handle
+        if ORJSON_AVAILABLE:
+            file_handler = JSONBytesRotatingFileHandler(
+                log_file,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                delay=True
+            )
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding='utf-8',
+                delay=True
+            )
         file_handler.setFormatter(json_formatter)
-        self.logger.addHandler(file_handler)
+        
+        # Buffer records so bursts reach the disk in a few large writes;
+        # errors flush immediately, buffered records are written within about
+        # flush_interval seconds, and buffer_size 0 writes every record
+        buffer_size = self.config.get('buffer_size', self.DEFAULT_BUFFER_SIZE)
+        if buffer_size > 0:
+            buffered_handler = TimedMemoryHandler(
+                capacity=buffer_size,
+                flush_interval=self.config.get('flush_interval', self.DEFAULT_FLUSH_INTERVAL),
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True
+            )
+            buffered_handler.setFormatter(json_formatter)  # Callers read handlers[0].formatter
+            atexit.register(buffered_handler.close)
+            self.logger.addHandler(buffered_handler)
+        else:
+            self.logger.addHandler(file_handler)
         
         # Console handler for development
         if self.config.get('console', False):
@@ -205,36 +327,39 @@ class StructuredLogger:
     
     def _parse_size(self, size_str: str) -> int:
         """Parse size string to bytes."""
-        size_str = size_str.upper()
-        if size_str.endswith('KB'):
-            return int(size_str[:-2]) * 1024
-        elif size_str.endswith('MB'):
-            return int(size_str[:-2]) * 1024 * 1024
-        elif size_str.endswith('GB'):
-            return int(size_str[:-2]) * 1024 * 1024 * 1024
-        else:
-            return int(size_str)
+        match = _SIZE_RE.match(str(size_str).strip())
+        if not match:
+            raise ValueError(f"Invalid size: {size_str!r}")
+        number, unit = match.groups()
+        return int(number) * _SIZE_MULTIPLIERS.get(unit.upper() if unit else '', 1)
     
     def log(self, level: LogLevel, message: str, **kwargs) -> None:
         """Log message with structured data."""
         log_level = getattr(logging, level.value)
-        self.logger.log(log_level, message, extra=kwargs)
+        if self.logger.isEnabledFor(log_level):
+            self.logger.log(log_level, message, extra=kwargs)
+    
+    # Level wrappers check the level first so filtered calls skip record creation
     
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message."""
-        self.log(LogLevel.DEBUG, message, **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, extra=kwargs)
     
     def info(self, message: str, **kwargs) -> None:
         """Log info message."""
-        self.log(LogLevel.INFO, message, **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, extra=kwargs)
     
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message."""
-        self.log(LogLevel.WARNING, message, **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(message, extra=kwargs)
     
     def error(self, message: str, **kwargs) -> None:
         """Log error message."""
-        self.log(LogLevel.ERROR, message, **kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(message, extra=kwargs)
         
         # Track error counts
         error_type = kwargs.get('error_type', 'unknown')
@@ -242,7 +367,8 @@ class StructuredLogger:
     
     def critical(self, message: str, **kwargs) -> None:
         """Log critical message."""
-        self.log(LogLevel.CRITICAL, message, **kwargs)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(message, extra=kwargs)
     
     def exception(self, message: str, **kwargs) -> None:
         """Log exception with traceback."""
@@ -510,16 +636,16 @@ class HealthChecker:
                 message="No health checks have been run"
             )
         
-        # Determine overall status
-        statuses = [result.status for result in self.last_results.values()]
+        # Tally statuses in one pass; the worst one present wins
+        counts = Counter(result.status for result in self.last_results.values())
         
-        if HealthStatus.CRITICAL in statuses:
+        if counts[HealthStatus.CRITICAL]:
             overall_status = HealthStatus.CRITICAL
             message = "One or more critical health issues detected"
-        elif HealthStatus.WARNING in statuses:
+        elif counts[HealthStatus.WARNING]:
             overall_status = HealthStatus.WARNING
             message = "One or more warnings detected"
-        elif HealthStatus.UNKNOWN in statuses:
+        elif counts[HealthStatus.UNKNOWN]:
             overall_status = HealthStatus.UNKNOWN
             message = "Some health checks have unknown status"
         else:
@@ -532,10 +658,10 @@ class HealthChecker:
             message=message,
             details={
                 'check_count': len(self.last_results),
-                'healthy_count': sum(1 for r in self.last_results.values() if r.status == HealthStatus.HEALTHY),
-                'warning_count': sum(1 for r in self.last_results.values() if r.status == HealthStatus.WARNING),
-                'critical_count': sum(1 for r in self.last_results.values() if r.status == HealthStatus.CRITICAL),
-                'unknown_count': sum(1 for r in self.last_results.values() if r.status == HealthStatus.UNKNOWN)
+                'healthy_count': counts[HealthStatus.HEALTHY],
+                'warning_count': counts[HealthStatus.WARNING],
+                'critical_count': counts[HealthStatus.CRITICAL],
+                'unknown_count': counts[HealthStatus.UNKNOWN]
             }
         )
     
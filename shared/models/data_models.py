@@ -3,6 +3,8 @@ Data models for EFIS Data Manager.
 Defines data structures used across Windows and macOS components.
 """
 
+import os
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
@@ -10,6 +12,10 @@ from pathlib import Path
 from enum import Enum
 
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 class OperationStatus(Enum):
     """Status of system operations."""
     SUCCESS = "success"
@@ -27,7 +33,15 @@ class DriveStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# EFISDrive file list attribute for each file type
+_DRIVE_FILE_ATTRS = {
+    'demo': 'demo_files',
+    'snap': 'snap_files',
+    'logbook': 'logbook_files'
+}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class FileMetadata:
     """Metadata for tracked files."""
     path: str
@@ -37,12 +51,11 @@ class FileMetadata:
     version: Optional[str] = None
     
     def __post_init__(self):
-        """Convert string path to Path object if needed."""
-        if isinstance(self.path, str):
-            self.path = Path(self.path)
+        """Normalize the path as a string, without touching the filesystem."""
+        object.__setattr__(self, 'path', os.path.normpath(self.path))
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SyncResult:
     """Result of file synchronization operation."""
     status: OperationStatus
@@ -63,7 +76,7 @@ class SyncResult:
         self.add_error(error)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class EFISDrive:
     """Represents an EFIS USB drive."""
     mount_path: str
@@ -78,6 +91,16 @@ class EFISDrive:
         """Convert string path to Path object if needed."""
         if isinstance(self.mount_path, str):
             self.mount_path = Path(self.mount_path)
+    
+    @property
+    def total_files(self) -> int:
+        """Total number of EFIS files found on the drive."""
+        return len(self.demo_files) + len(self.snap_files) + len(self.logbook_files)
+    
+    def get_files_by_type(self, file_type: str) -> List[str]:
+        """Get the files of one type ('demo', 'snap' or 'logbook')."""
+        attr = _DRIVE_FILE_ATTRS.get(file_type.lower())
+        return getattr(self, attr) if attr else []
 
 
 @dataclass
@@ -108,7 +131,7 @@ class GRTSoftwareInfo:
     description: Optional[str] = None
     
     
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DownloadResult:
     """Result of file download operation."""
     status: OperationStatus
@@ -122,7 +145,7 @@ class DownloadResult:
         self.errors.append(error)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessResult:
     """Result of USB drive processing operation."""
     status: OperationStatus
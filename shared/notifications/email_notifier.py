@@ -2,18 +2,198 @@
 Email notification system for EFIS Data Manager.
 """
 
+import re
 import smtplib
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Optional, Dict, Any
+from email.message import EmailMessage
+from html import escape as html_escape
+from typing import Optional, Dict, Any, List
 from datetime import datetime
+from string import Template
 from .notification_types import Notification, NotificationType
 
 
+# Email body templates are built once at import; only the per-notification
+# fields are substituted when a message is rendered.
+_TEXT_TEMPLATE = Template("""
+EFIS Data Manager Notification
+
+Title: $title
+Type: $type
+Priority: $priority
+Component: $component
+Time: $time
+
+Message:
+$message
+$operation$details
+
+---
+This is an automated message from EFIS Data Manager.""")
+
+_HTML_OPERATION_ROW = Template("""
+                        <tr>
+                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; font-weight: bold; color: #495057;">Operation:</td>
+                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; color: #6c757d;">$operation</td>
+                        </tr>
+""")
+
+_HTML_DETAILS_SECTION = Template("""
+                    <h3 style="color: #333; margin-top: 20px;">Details:</h3>
+                    <div style="background-color: #f8f9fa; padding: 15px; border-radius: 4px;">
+$rows</div>""")
+
+_HTML_DETAILS_ROW = Template(
+    "<p style='margin: 5px 0; color: #495057;'><strong>$key:</strong> $value</p>"
+)
+
+_HTML_TEMPLATE = Template("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <title>EFIS Data Manager Notification</title>
+        </head>
+        <body style="font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f8f9fa;">
+            <div style="max-width: 600px; margin: 0 auto; background-color: white; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+                <div style="background-color: $color; color: white; padding: 20px; border-radius: 8px 8px 0 0;">
+                    <h1 style="margin: 0; font-size: 24px;">EFIS Data Manager</h1>
+                    <p style="margin: 5px 0 0 0; opacity: 0.9;">$type Notification</p>
+                </div>
+                
+                <div style="padding: 20px;">
+                    <h2 style="color: #333; margin-top: 0;">$title</h2>
+                    
+                    <div style="background-color: #f8f9fa; padding: 15px; border-radius: 4px; margin: 15px 0;">
+                        <p style="margin: 0; color: #495057;">$message</p>
+                    </div>
+                    
+                    <table style="width: 100%; border-collapse: collapse; margin: 15px 0;">
+                        <tr>
+                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; font-weight: bold; color: #495057;">Time:</td>
+                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; color: #6c757d;">$time</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; font-weight: bold; color: #495057;">Component:</td>
+                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; color: #6c757d;">$component</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; font-weight: bold; color: #495057;">Priority:</td>
+                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; color: #6c757d;">$priority</td>
+                        </tr>
+$operation_row
+                    </table>
+$details_section
+                </div>
+                
+                <div style="background-color: #f8f9fa; padding: 15px; border-radius: 0 0 8px 8px; text-align: center; color: #6c757d; font-size: 12px;">
+                    This is an automated message from EFIS Data Manager.
+                </div>
+            </div>
+        </body>
+        </html>
+""")
+
+
+# End-of-data marker for the SMTP DATA command
+_DATA_END = b"." + smtplib.bCRLF
+
+# Line breaks normalized to CRLF, and lines starting with a period that must
+# be doubled inside DATA (RFC 5321 section 4.5.2)
+_LINE_BREAK_RE = re.compile(r'\r\n|\n|\r(?!\n)')
+_LEADING_PERIOD_RE = re.compile(br'(?m)^\.')
+
+
+class _PipeliningSMTP(smtplib.SMTP):
+    """
+    SMTP client that pipelines the message envelope (RFC 2920).
+    
+    When the server advertises PIPELINING, MAIL FROM, every RCPT TO and DATA
+    are written as one command group and their replies are read afterwards,
+    so each message costs a single round trip before the body is sent.
+    Falls back to the standard lock-step exchange otherwise.
+    """
+    
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        """Send a message, pipelining the envelope commands when supported."""
+        self.ehlo_or_helo_if_needed()
+        if mail_options or rcpt_options or not self.has_extn('pipelining'):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+        
+        if isinstance(msg, str):
+            msg = _LINE_BREAK_RE.sub('\r\n', msg).encode('ascii')
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+        
+        size_option = f" size={len(msg)}" if self.has_extn('size') else ""
+        commands = [f"MAIL FROM:{smtplib.quoteaddr(from_addr)}{size_option}"]
+        commands.extend(f"RCPT TO:{smtplib.quoteaddr(addr)}" for addr in to_addrs)
+        commands.append("DATA")
+        self.send("".join(f"{command}\r\n" for command in commands))
+        
+        # Replies arrive in command order; all of them must be consumed
+        mail_code, mail_resp = self.getreply()
+        senderrs = {}
+        for addr in to_addrs:
+            code, resp = self.getreply()
+            if code not in (250, 251):
+                senderrs[addr] = (code, resp)
+        data_code, data_resp = self.getreply()
+        
+        if data_code == 354 and (mail_code != 250 or len(senderrs) == len(to_addrs)):
+            # Server accepted DATA without a valid envelope; end it empty
+            self.send(_DATA_END)
+            self.getreply()
+        
+        if mail_code != 250:
+            self._abort_transaction(mail_code)
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+        if len(senderrs) == len(to_addrs):
+            self._abort_transaction(data_code)
+            raise smtplib.SMTPRecipientsRefused(senderrs)
+        if data_code != 354:
+            self._abort_transaction(data_code)
+            raise smtplib.SMTPDataError(data_code, data_resp)
+        
+        # Terminate the body in one concatenation rather than appending twice
+        body = _LEADING_PERIOD_RE.sub(b'..', msg)
+        terminator = _DATA_END if body.endswith(smtplib.bCRLF) else smtplib.bCRLF + _DATA_END
+        self.send(body + terminator)
+        
+        code, resp = self.getreply()
+        if code != 250:
+            self._abort_transaction(code)
+            raise smtplib.SMTPDataError(code, resp)
+        
+        return senderrs
+    
+    def _abort_transaction(self, code: int) -> None:
+        """Reset the mail transaction, or close if the server is shutting down."""
+        if code == 421:
+            self.close()
+            return
+        try:
+            self.rset()
+        except smtplib.SMTPServerDisconnected:
+            pass  # Connection already gone; nothing left to reset
+
+
 class EmailNotifier:
     """Email notification handler."""
     
+    # Header color for each notification type in HTML emails
+    COLOR_MAP = {
+        NotificationType.SUCCESS: "#28a745",
+        NotificationType.INFO: "#17a2b8",
+        NotificationType.WARNING: "#ffc107",
+        NotificationType.ERROR: "#dc3545",
+        NotificationType.CRITICAL: "#6f42c1"
+    }
+    DEFAULT_COLOR = "#6c757d"
+    
+    # Short notifications without details are sent as plain text only
+    HTML_MIN_MESSAGE_LENGTH = 512
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize email notifier."""
         self.config = config or {}
@@ -26,38 +206,70 @@ class EmailNotifier:
         self.password = self.config.get('password')
         self.from_email = self.config.get('from_email', self.username)
         self.to_email = self.config.get('to_email')
+        self.send_html = self.config.get('html', True)
+        self.force_html = self.config.get('force_html', False)
         
     def send_notification(self, notification: Notification) -> bool:
         """Send email notification."""
+        return self.send_many([notification]) == 1
+    
+    def send_many(self, notifications: List[Notification]) -> int:
+        """
+        Send several notifications over a single SMTP session.
+        
+        The connection, STARTTLS negotiation and login are performed once for
+        the whole batch. A notification whose recipients are refused is
+        skipped without aborting the rest of the batch.
+        
+        Args:
+            notifications: Notifications to deliver
+            
+        Returns:
+            Number of notifications successfully sent
+        """
+        if not notifications:
+            return 0
+        
         if not self._validate_config():
             self.logger.error("Email configuration incomplete")
-            return False
+            return 0
         
+        sent = 0
         try:
-            # Create message
-            msg = self._create_message(notification)
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+            with _PipeliningSMTP(self.smtp_server, self.smtp_port) as server:
                 server.starttls()
                 server.login(self.username, self.password)
-                server.send_message(msg)
-            
-            self.logger.info(f"Email notification sent: {notification.title}")
-            return True
+                
+                for notification in notifications:
+                    try:
+                        server.send_message(self._create_message(notification))
+                        sent += 1
+                        self.logger.info(f"Email notification sent: {notification.title}")
+                    except smtplib.SMTPRecipientsRefused as e:
+                        self.logger.warning(
+                            f"Email recipients refused for '{notification.title}': {e.recipients}"
+                        )
             
         except Exception as e:
             self.logger.error(f"Failed to send email notification: {e}")
-            return False
+        
+        return sent
     
     def _validate_config(self) -> bool:
         """Validate email configuration."""
         required_fields = ['username', 'password', 'to_email']
         return all(self.config.get(field) for field in required_fields)
     
-    def _create_message(self, notification: Notification) -> MIMEMultipart:
-        """Create email message from notification."""
-        msg = MIMEMultipart('alternative')
+    def _create_message(self, notification: Notification) -> EmailMessage:
+        """
+        Create email message from notification.
+        
+        The message is plain text only when HTML email is disabled in the
+        config, or when the notification is short (no details and a message
+        under HTML_MIN_MESSAGE_LENGTH characters) unless 'force_html' is set.
+        Otherwise it is multipart/alternative with text and HTML parts.
+        """
+        msg = EmailMessage()
         
         # Set headers
         msg['Subject'] = f"[EFIS Data Manager] {notification.title}"
@@ -65,127 +277,68 @@ class EmailNotifier:
         msg['To'] = self.to_email
         msg['Date'] = notification.timestamp.strftime('%a, %d %b %Y %H:%M:%S %z')
         
-        # Create text content
-        text_content = self._create_text_content(notification)
-        text_part = MIMEText(text_content, 'plain')
-        msg.attach(text_part)
+        msg.set_content(self._create_text_content(notification))
         
-        # Create HTML content
-        html_content = self._create_html_content(notification)
-        html_part = MIMEText(html_content, 'html')
-        msg.attach(html_part)
+        if self._wants_html(notification):
+            msg.add_alternative(self._create_html_content(notification), subtype='html')
         
         return msg
     
+    def _wants_html(self, notification: Notification) -> bool:
+        """Check if an HTML alternative should be generated for the notification."""
+        if not self.send_html:
+            return False
+        if self.force_html or notification.details:
+            return True
+        return len(notification.message) >= self.HTML_MIN_MESSAGE_LENGTH
+    
     def _create_text_content(self, notification: Notification) -> str:
         """Create plain text email content."""
-        content = f"""
-EFIS Data Manager Notification
-
-Title: {notification.title}
-Type: {notification.notification_type.value.upper()}
-Priority: {notification.priority.name}
-Component: {notification.component}
-Time: {notification.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-
-Message:
-{notification.message}
-"""
-        
-        if notification.operation:
-            content += f"\nOperation: {notification.operation}"
+        operation = f"\nOperation: {notification.operation}" if notification.operation else ""
         
+        details = ""
         if notification.details:
-            content += "\n\nDetails:"
-            for key, value in notification.details.items():
-                content += f"\n  {key}: {value}"
+            details = "\n\nDetails:" + "".join(
+                f"\n  {key}: {value}" for key, value in notification.details.items()
+            )
         
-        content += "\n\n---\nThis is an automated message from EFIS Data Manager."
-        
-        return content
+        return _TEXT_TEMPLATE.substitute(
+            title=notification.title,
+            type=notification.notification_type.value.upper(),
+            priority=notification.priority.name,
+            component=notification.component,
+            time=notification.display_time,
+            message=notification.message,
+            operation=operation,
+            details=details
+        )
     
     def _create_html_content(self, notification: Notification) -> str:
-        """Create HTML email content."""
-        # Color mapping for notification types
-        color_map = {
-            NotificationType.SUCCESS: "#28a745",
-            NotificationType.INFO: "#17a2b8",
-            NotificationType.WARNING: "#ffc107",
-            NotificationType.ERROR: "#dc3545",
-            NotificationType.CRITICAL: "#6f42c1"
-        }
-        
-        color = color_map.get(notification.notification_type, "#6c757d")
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>EFIS Data Manager Notification</title>
-        </head>
-        <body style="font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f8f9fa;">
-            <div style="max-width: 600px; margin: 0 auto; background-color: white; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                <div style="background-color: {color}; color: white; padding: 20px; border-radius: 8px 8px 0 0;">
-                    <h1 style="margin: 0; font-size: 24px;">EFIS Data Manager</h1>
-                    <p style="margin: 5px 0 0 0; opacity: 0.9;">{notification.notification_type.value.upper()} Notification</p>
-                </div>
-                
-                <div style="padding: 20px;">
-                    <h2 style="color: #333; margin-top: 0;">{notification.title}</h2>
-                    
-                    <div style="background-color: #f8f9fa; padding: 15px; border-radius: 4px; margin: 15px 0;">
-                        <p style="margin: 0; color: #495057;">{notification.message}</p>
-                    </div>
-                    
-                    <table style="width: 100%; border-collapse: collapse; margin: 15px 0;">
-                        <tr>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; font-weight: bold; color: #495057;">Time:</td>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; color: #6c757d;">{notification.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; font-weight: bold; color: #495057;">Component:</td>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; color: #6c757d;">{notification.component}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; font-weight: bold; color: #495057;">Priority:</td>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; color: #6c757d;">{notification.priority.name}</td>
-                        </tr>
-        """
-        
+        """Create HTML email content with all notification text HTML-escaped."""
+        operation_row = ""
         if notification.operation:
-            html += f"""
-                        <tr>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; font-weight: bold; color: #495057;">Operation:</td>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #dee2e6; color: #6c757d;">{notification.operation}</td>
-                        </tr>
-            """
-        
-        html += """
-                    </table>
-        """
+            operation_row = _HTML_OPERATION_ROW.substitute(operation=html_escape(notification.operation))
         
+        details_section = ""
         if notification.details:
-            html += """
-                    <h3 style="color: #333; margin-top: 20px;">Details:</h3>
-                    <div style="background-color: #f8f9fa; padding: 15px; border-radius: 4px;">
-            """
-            for key, value in notification.details.items():
-                html += f"<p style='margin: 5px 0; color: #495057;'><strong>{key}:</strong> {value}</p>"
-            html += "</div>"
-        
-        html += """
-                </div>
-                
-                <div style="background-color: #f8f9fa; padding: 15px; border-radius: 0 0 8px 8px; text-align: center; color: #6c757d; font-size: 12px;">
-                    This is an automated message from EFIS Data Manager.
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+            details_section = _HTML_DETAILS_SECTION.substitute(
+                rows="".join(
+                    _HTML_DETAILS_ROW.substitute(key=html_escape(str(key)), value=html_escape(str(value)))
+                    for key, value in notification.details.items()
+                )
+            )
         
-        return html
+        return _HTML_TEMPLATE.substitute(
+            color=self.COLOR_MAP.get(notification.notification_type, self.DEFAULT_COLOR),
+            type=notification.notification_type.value.upper(),
+            title=html_escape(notification.title),
+            message=html_escape(notification.message),
+            time=notification.display_time,
+            component=html_escape(notification.component),
+            priority=notification.priority.name,
+            operation_row=operation_row,
+            details_section=details_section
+        )
     
     def update_config(self, config: Dict[str, Any]) -> None:
         """Update email configuration."""
@@ -196,6 +349,8 @@ Message:
         self.password = self.config.get('password')
         self.from_email = self.config.get('from_email', self.username)
         self.to_email = self.config.get('to_email')
+        self.send_html = self.config.get('html', True)
+        self.force_html = self.config.get('force_html', False)
     
     def test_connection(self) -> bool:
         """Test email connection and authentication."""
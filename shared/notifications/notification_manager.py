@@ -2,27 +2,166 @@
 Cross-platform notification manager for EFIS Data Manager.
 """
 
+import asyncio
+import atexit
 import platform
 import logging
+import queue
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
+from xml.sax.saxutils import escape as xml_escape
 from .notification_types import Notification, NotificationPreferences, NotificationType, NotificationPriority
 from .email_notifier import EmailNotifier
 
+try:
+    from win10toast import ToastNotifier
+    WIN10TOAST_AVAILABLE = True
+except ImportError:
+    ToastNotifier = None
+    WIN10TOAST_AVAILABLE = False
+
+try:
+    import winsdk.windows.data.xml.dom as xml_dom
+    import winsdk.windows.ui.notifications as win_notifications
+    WINSDK_AVAILABLE = True
+except ImportError:
+    xml_dom = None
+    win_notifications = None
+    WINSDK_AVAILABLE = False
+
+
+# macOS notification sound for each notification type
+_MACOS_SOUNDS = {
+    NotificationType.SUCCESS: "Glass",
+    NotificationType.INFO: "Blow",
+    NotificationType.WARNING: "Sosumi",
+    NotificationType.ERROR: "Basso",
+    NotificationType.CRITICAL: "Funk"
+}
+
+# Constant AppleScript for macOS notifications; message, title and sound are
+# supplied as argv items 1-3
+_OSASCRIPT_NOTIFY = (
+    "osascript",
+    "-e", "on run argv",
+    "-e", "display notification (item 1 of argv) with title (item 2 of argv) sound name (item 3 of argv)",
+    "-e", "end run",
+    "--",
+)
+
+# Toast payload for the Windows Runtime and PowerShell toast paths
+_TOAST_XML_TEMPLATE = (
+    '<toast><visual><binding template="ToastGeneric">'
+    '<text>{title}</text><text>{message}</text>'
+    '</binding></visual></toast>'
+)
+
+# Toast fallback script for the shared PowerShell host. It is sent as a single
+# line over stdin and always reports its outcome on a sentinel-prefixed line.
+_PS_SENTINEL = "__EFIS_DONE__"
+_XML_LINE_BREAKS = {"\n": "&#10;", "\r": "&#13;"}
+
+_PS_TOAST_SCRIPT = (
+    "try {{ "
+    "[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null; "
+    "[Windows.UI.Notifications.ToastNotification, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null; "
+    "[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null; "
+    "$xml = New-Object Windows.Data.Xml.Dom.XmlDocument; "
+    "$xml.LoadXml('{template}'); "
+    "$toast = New-Object Windows.UI.Notifications.ToastNotification $xml; "
+    "[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier('EFIS Data Manager').Show($toast); "
+    "Write-Output '{sentinel}OK' "
+    "}} catch {{ Write-Output \"{sentinel}$($_.Exception.Message)\" }}"
+)
+
 
 class NotificationManager:
     """Cross-platform notification manager."""
     
+    # Email batching: up to EMAIL_BATCH_SIZE queued notifications are sent
+    # over one SMTP session, waiting at most EMAIL_BATCH_WAIT seconds for
+    # each additional notification before flushing the batch.
+    EMAIL_QUEUE_SIZE = 1000
+    EMAIL_BATCH_SIZE = 100
+    EMAIL_BATCH_WAIT = 1.0
+    
+    # Identical notifications (same title, message and type) repeated within
+    # DEDUPE_WINDOW seconds are suppressed; up to DEDUPE_MAX_ENTRIES recent
+    # notifications are remembered.
+    DEDUPE_WINDOW = 30.0
+    DEDUPE_MAX_ENTRIES = 256
+    
+    # Seconds to wait for the PowerShell host to acknowledge a toast
+    POWERSHELL_TIMEOUT = 10.0
+    
     def __init__(self, preferences: Optional[NotificationPreferences] = None):
         """Initialize notification manager."""
         self.preferences = preferences or NotificationPreferences()
         self.logger = logging.getLogger(__name__)
         self.email_notifier = EmailNotifier() if self.preferences.enable_email else None
         self._platform = platform.system().lower()
+        self._desktop_send = {
+            "darwin": self._send_macos_notification,
+            "windows": self._send_windows_notification,
+        }.get(self._platform, self._send_unsupported_notification)
+        
+        # Recently sent notifications for duplicate suppression
+        self._recent: "OrderedDict[tuple, float]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+        
+        # Background email delivery
+        self._email_queue: "queue.Queue[Optional[Notification]]" = queue.Queue(
+            maxsize=self.EMAIL_QUEUE_SIZE
+        )
+        self._email_thread: Optional[threading.Thread] = None
+        
+        # Shared executor for running blocking notification work off the
+        # caller's event loop
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notification")
+        
+        # Windows toast senders (win10toast, WinRT notifier and long-lived
+        # PowerShell host), each created lazily on first use
+        self._toaster = None
+        self._toast_notifier = None
+        self._ps = None
+        self._ps_lock = threading.Lock()
+        
+        if self.email_notifier:
+            self._start_email_worker()
         
     def notify(self, notification: Notification) -> bool:
-        """Send notification through appropriate channels."""
+        """
+        Send notification through appropriate channels.
+        
+        Email is only queued here and delivered by the background worker, so
+        it never adds to the time this call takes. It is queued before the
+        desktop notification so the worker can start on it sooner.
+        
+        Filtered notification types are dropped before any other work, and
+        duplicates of a notification sent within DEDUPE_WINDOW seconds are
+        suppressed; both are reported as successful.
+        """
+        if self.preferences.is_filtered(notification):
+            return True
+        
+        if self._is_duplicate(notification):
+            self.logger.debug(f"Suppressed duplicate notification: {notification.title}")
+            return True
+        
         success = True
         
+        # Email notification (delivered in batches by the background worker)
+        if self.preferences.should_notify_email(notification) and self.email_notifier:
+            try:
+                self._email_queue.put(notification, block=False)
+            except queue.Full:
+                self.logger.warning(f"Email queue full, dropping notification: {notification.title}")
+                success = False
+        
         # Desktop notification
         if self.preferences.should_notify_desktop(notification):
             try:
@@ -31,51 +170,112 @@ class NotificationManager:
                 self.logger.error(f"Failed to send desktop notification: {e}")
                 success = False
         
-        # Email notification
-        if self.preferences.should_notify_email(notification) and self.email_notifier:
+        return success
+    
+    def _is_duplicate(self, notification: Notification) -> bool:
+        """Check for a recent identical notification and record this one."""
+        key = (notification.title, notification.message, notification.notification_type)
+        now = time.monotonic()
+        
+        with self._recent_lock:
+            sent_at = self._recent.get(key)
+            if sent_at is not None and now - sent_at < self.DEDUPE_WINDOW:
+                return True
+            
+            self._recent[key] = now
+            self._recent.move_to_end(key)
+            if len(self._recent) > self.DEDUPE_MAX_ENTRIES:
+                self._recent.popitem(last=False)
+        
+        return False
+    
+    async def anotify(self, notification: Notification) -> bool:
+        """
+        Send notification without blocking the running event loop.
+        
+        The desktop channel (which may spawn a subprocess) runs on a shared
+        worker thread; email is handed to the background delivery queue.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.notify, notification)
+    
+    def _start_email_worker(self) -> None:
+        """Start the background email delivery thread."""
+        if self._email_thread and self._email_thread.is_alive():
+            return
+        
+        self._email_thread = threading.Thread(
+            target=self._email_worker,
+            name="notification-email-worker",
+            daemon=True
+        )
+        self._email_thread.start()
+        
+        # The worker is a daemon thread, so flush it explicitly at exit;
+        # otherwise emails queued just before a short-lived process ends
+        # would be dropped
+        atexit.unregister(self.stop_email_worker)  # Avoid duplicates on restart
+        atexit.register(self.stop_email_worker)
+    
+    def stop_email_worker(self, timeout: float = 5.0) -> None:
+        """Flush pending emails and stop the background delivery thread."""
+        atexit.unregister(self.stop_email_worker)
+        if not self._email_thread or not self._email_thread.is_alive():
+            return
+        
+        self._email_queue.put(None)
+        self._email_thread.join(timeout=timeout)
+        self._email_thread = None
+    
+    def _email_worker(self) -> None:
+        """Drain the email queue, sending each batch over one SMTP session."""
+        running = True
+        while running:
+            first = self._email_queue.get()
+            if first is None:
+                break
+            
+            batch = [first]
+            while len(batch) < self.EMAIL_BATCH_SIZE:
+                try:
+                    notification = self._email_queue.get(timeout=self.EMAIL_BATCH_WAIT)
+                except queue.Empty:
+                    break
+                if notification is None:
+                    running = False
+                    break
+                batch.append(notification)
+            
+            notifier = self.email_notifier
+            if not notifier:
+                self.logger.debug(f"Email disabled, discarding {len(batch)} queued notifications")
+                continue
+            
             try:
-                success &= self.email_notifier.send_notification(notification)
+                sent = notifier.send_many(batch)
+                if sent < len(batch):
+                    self.logger.error(f"Failed to send {len(batch) - sent} of {len(batch)} email notifications")
             except Exception as e:
-                self.logger.error(f"Failed to send email notification: {e}")
-                success = False
-        
-        return success
+                self.logger.error(f"Failed to send email notifications: {e}")
     
     def _send_desktop_notification(self, notification: Notification) -> bool:
         """Send platform-specific desktop notification."""
-        if self._platform == "darwin":
-            return self._send_macos_notification(notification)
-        elif self._platform == "windows":
-            return self._send_windows_notification(notification)
-        else:
-            self.logger.warning(f"Desktop notifications not supported on {self._platform}")
-            return False
+        return self._desktop_send(notification)
+    
+    def _send_unsupported_notification(self, notification: Notification) -> bool:
+        """Report that desktop notifications are unavailable on this platform."""
+        self.logger.warning(f"Desktop notifications not supported on {self._platform}")
+        return False
     
     def _send_macos_notification(self, notification: Notification) -> bool:
         """Send macOS notification using osascript."""
         try:
-            import subprocess
-            
-            # Map notification types to macOS sounds
-            sound_map = {
-                NotificationType.SUCCESS: "Glass",
-                NotificationType.INFO: "Blow",
-                NotificationType.WARNING: "Sosumi",
-                NotificationType.ERROR: "Basso",
-                NotificationType.CRITICAL: "Funk"
-            }
-            
-            sound = sound_map.get(notification.notification_type, "Blow")
-            
-            # Build AppleScript command
-            script = f'''
-            display notification "{notification.message}" ¬
-                with title "{notification.title}" ¬
-                sound name "{sound}"
-            '''
+            sound = _MACOS_SOUNDS.get(notification.notification_type, "Blow")
             
+            # Text is passed as script arguments, never interpolated into
+            # the AppleScript source
             result = subprocess.run(
-                ["osascript", "-e", script],
+                [*_OSASCRIPT_NOTIFY, notification.message, notification.title, sound],
                 capture_output=True,
                 text=True,
                 timeout=10
@@ -95,23 +295,15 @@ class NotificationManager:
     def _send_windows_notification(self, notification: Notification) -> bool:
         """Send Windows toast notification."""
         try:
-            # Try using win10toast if available
-            try:
-                from win10toast import ToastNotifier
-                toaster = ToastNotifier()
-                
-                # Map notification types to icons
-                icon_map = {
-                    NotificationType.SUCCESS: None,  # Default icon
-                    NotificationType.INFO: None,
-                    NotificationType.WARNING: None,
-                    NotificationType.ERROR: None,
-                    NotificationType.CRITICAL: None
-                }
+            # Prefer win10toast, then in-process Windows Runtime toasts,
+            # then the PowerShell host
+            if WIN10TOAST_AVAILABLE:
+                if self._toaster is None:
+                    self._toaster = ToastNotifier()
                 
                 duration = 10 if notification.priority.value >= NotificationPriority.HIGH.value else 5
                 
-                toaster.show_toast(
+                self._toaster.show_toast(
                     title=notification.title,
                     msg=notification.message,
                     duration=duration,
@@ -120,67 +312,121 @@ class NotificationManager:
                 
                 self.logger.debug(f"Windows toast notification sent: {notification.title}")
                 return True
-                
-            except ImportError:
-                # Fallback to PowerShell if win10toast not available
-                return self._send_windows_powershell_notification(notification)
+            
+            if WINSDK_AVAILABLE:
+                return self._send_windows_runtime_notification(notification)
+            
+            return self._send_windows_powershell_notification(notification)
                 
         except Exception as e:
             self.logger.error(f"Failed to send Windows notification: {e}")
             return False
     
+    def _send_windows_runtime_notification(self, notification: Notification) -> bool:
+        """Send Windows toast notification through the winsdk WinRT bindings."""
+        xml = xml_dom.XmlDocument()
+        xml.load_xml(_TOAST_XML_TEMPLATE.format(
+            title=xml_escape(notification.title),
+            message=xml_escape(notification.message)
+        ))
+        
+        if self._toast_notifier is None:
+            self._toast_notifier = win_notifications.ToastNotificationManager.create_toast_notifier(
+                "EFIS Data Manager"
+            )
+        self._toast_notifier.show(win_notifications.ToastNotification(xml))
+        
+        self.logger.debug(f"Windows runtime notification sent: {notification.title}")
+        return True
+    
     def _send_windows_powershell_notification(self, notification: Notification) -> bool:
-        """Send Windows notification using PowerShell."""
+        """Send Windows notification using the long-lived PowerShell host."""
         try:
-            import subprocess
-            
-            # PowerShell script for toast notification
-            ps_script = f'''
-            [Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
-            [Windows.UI.Notifications.ToastNotification, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
-            [Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
-            
-            $template = @"
-            <toast>
-                <visual>
-                    <binding template="ToastGeneric">
-                        <text>{notification.title}</text>
-                        <text>{notification.message}</text>
-                    </binding>
-                </visual>
-            </toast>
-            "@
-            
-            $xml = New-Object Windows.Data.Xml.Dom.XmlDocument
-            $xml.LoadXml($template)
-            $toast = New-Object Windows.UI.Notifications.ToastNotification $xml
-            [Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("EFIS Data Manager").Show($toast)
-            '''
-            
-            result = subprocess.run(
-                ["powershell", "-Command", ps_script],
-                capture_output=True,
-                text=True,
-                timeout=10
+            template = _TOAST_XML_TEMPLATE.format(
+                title=xml_escape(notification.title, _XML_LINE_BREAKS),
+                message=xml_escape(notification.message, _XML_LINE_BREAKS)
+            )
+            # Single-quoted PowerShell string: embedded quotes are doubled
+            ps_script = _PS_TOAST_SCRIPT.format(
+                template=template.replace("'", "''"),
+                sentinel=_PS_SENTINEL
             )
             
-            if result.returncode == 0:
+            status = self._run_powershell(ps_script)
+            
+            if status == "OK":
                 self.logger.debug(f"Windows PowerShell notification sent: {notification.title}")
                 return True
             else:
-                self.logger.error(f"Windows PowerShell notification failed: {result.stderr}")
+                self.logger.error(f"Windows PowerShell notification failed: {status}")
                 return False
                 
         except Exception as e:
             self.logger.error(f"Failed to send Windows PowerShell notification: {e}")
             return False
     
+    def _run_powershell(self, ps_script: str) -> str:
+        """
+        Run a one-line script in the shared PowerShell host.
+        
+        The host is started on first use and kept open so each notification
+        avoids the PowerShell/CLR startup cost. The script must write a line
+        starting with the sentinel; the remainder of that line is returned.
+        If no sentinel arrives within POWERSHELL_TIMEOUT the host is killed
+        and restarted on the next call.
+        """
+        with self._ps_lock:
+            if self._ps is None or self._ps.poll() is not None:
+                self._ps = subprocess.Popen(
+                    ["powershell", "-NoProfile", "-NoLogo", "-Command", "-"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1
+                )
+            
+            ps = self._ps
+            watchdog = threading.Timer(self.POWERSHELL_TIMEOUT, ps.kill)
+            watchdog.start()
+            try:
+                ps.stdin.write(ps_script + "\n")
+                ps.stdin.flush()
+                
+                for line in ps.stdout:
+                    if line.startswith(_PS_SENTINEL):
+                        return line[len(_PS_SENTINEL):].strip()
+            finally:
+                watchdog.cancel()
+            
+            self._ps = None
+            return "PowerShell host exited or timed out"
+    
+    def _close_powershell_host(self) -> None:
+        """Terminate the shared PowerShell host if running."""
+        with self._ps_lock:
+            if self._ps is not None:
+                try:
+                    self._ps.stdin.close()
+                    self._ps.wait(timeout=5)
+                except Exception:
+                    self._ps.kill()
+                self._ps = None
+    
+    def close(self) -> None:
+        """Flush pending emails and release background resources."""
+        self.stop_email_worker()
+        self._close_powershell_host()
+        self._executor.shutdown(wait=False)
+    
     def update_preferences(self, preferences: NotificationPreferences) -> None:
         """Update notification preferences."""
         self.preferences = preferences
         if preferences.enable_email and not self.email_notifier:
             self.email_notifier = EmailNotifier()
+            self._start_email_worker()
         elif not preferences.enable_email:
+            self.stop_email_worker()
             self.email_notifier = None
     
     # Convenience methods for common notification types
@@ -2,10 +2,17 @@
 Notification types and data structures for EFIS Data Manager.
 """
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, time
 from enum import Enum
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, FrozenSet, Tuple
+
+
+# Notifications are created for every alert, so drop the per-instance __dict__
+# where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class NotificationType(Enum):
@@ -25,7 +32,13 @@ class NotificationPriority(Enum):
     URGENT = 4
 
 
-@dataclass
+@lru_cache(maxsize=128)
+def _format_display_time(timestamp: datetime) -> str:
+    """Format a timestamp for display, memoized across renderers."""
+    return timestamp.strftime('%Y-%m-%d %H:%M:%S')
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Notification:
     """Notification data structure."""
     title: str
@@ -37,6 +50,11 @@ class Notification:
     operation: Optional[str] = None
     details: Optional[Dict[str, Any]] = None
     
+    @property
+    def display_time(self) -> str:
+        """Timestamp formatted as 'YYYY-MM-DD HH:MM:SS'."""
+        return _format_display_time(self.timestamp)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert notification to dictionary."""
         return {
@@ -65,7 +83,7 @@ class Notification:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class NotificationPreferences:
     """User notification preferences."""
     enable_desktop: bool = True
@@ -73,17 +91,34 @@ class NotificationPreferences:
     email_address: Optional[str] = None
     min_priority_desktop: NotificationPriority = NotificationPriority.NORMAL
     min_priority_email: NotificationPriority = NotificationPriority.HIGH
-    filter_types: list = field(default_factory=list)  # Types to exclude
+    filter_types: FrozenSet[NotificationType] = field(default_factory=frozenset)  # Types to exclude
     quiet_hours_start: Optional[str] = None  # "22:00"
     quiet_hours_end: Optional[str] = None    # "08:00"
     
+    # Parsed quiet hours, keyed by the (start, end) strings they came from
+    _quiet_hours_key: Optional[Tuple[Optional[str], Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _quiet_hours: Optional[Tuple[time, time]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        """Store excluded types as a set for constant-time membership checks."""
+        self.filter_types = frozenset(self.filter_types)
+    
+    def is_filtered(self, notification: Notification) -> bool:
+        """Check if the notification's type is excluded from every channel."""
+        return notification.notification_type in self.filter_types
+    
+    # Checks below run cheapest-first; quiet hours (clock read) come last.
     def should_notify_desktop(self, notification: Notification) -> bool:
         """Check if desktop notification should be sent."""
         if not self.enable_desktop:
             return False
         if notification.priority.value < self.min_priority_desktop.value:
             return False
-        if notification.notification_type in self.filter_types:
+        if self.is_filtered(notification):
             return False
         return not self._is_quiet_hours()
     
@@ -93,20 +128,33 @@ class NotificationPreferences:
             return False
         if notification.priority.value < self.min_priority_email.value:
             return False
-        if notification.notification_type in self.filter_types:
+        if self.is_filtered(notification):
             return False
         return True
     
+    def _get_quiet_hours(self) -> Optional[Tuple[time, time]]:
+        """Get parsed quiet hours, re-parsing only when the settings change."""
+        key = (self.quiet_hours_start, self.quiet_hours_end)
+        if key != self._quiet_hours_key:
+            self._quiet_hours = None
+            if self.quiet_hours_start and self.quiet_hours_end:
+                self._quiet_hours = (
+                    datetime.strptime(self.quiet_hours_start, "%H:%M").time(),
+                    datetime.strptime(self.quiet_hours_end, "%H:%M").time()
+                )
+            self._quiet_hours_key = key
+        return self._quiet_hours
+    
     def _is_quiet_hours(self) -> bool:
         """Check if current time is within quiet hours."""
-        if not self.quiet_hours_start or not self.quiet_hours_end:
+        quiet_hours = self._get_quiet_hours()
+        if not quiet_hours:
             return False
         
         now = datetime.now().time()
-        start = datetime.strptime(self.quiet_hours_start, "%H:%M").time()
-        end = datetime.strptime(self.quiet_hours_end, "%H:%M").time()
+        start, end = quiet_hours
         
         if start <= end:
             return start <= now <= end
         else:  # Quiet hours span midnight
-            return now >= start or now <= end
\ No newline at end of file
+            return now >= start or now <= end
@@ -5,12 +5,91 @@ Provides structured logging with rotation and cross-platform support.
 
 import os
 import sys
+import copy
+import json
+import atexit
+import queue
 import logging
 import logging.handlers
 from pathlib import Path
 from typing import Optional, Dict, Any
 import colorlog
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+DEFAULT_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024  # 10MB
+DEFAULT_BACKUP_COUNT = 5
+
+CONSOLE_LOG_FORMAT = '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+CONSOLE_PLAIN_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+CONSOLE_DATE_FORMAT = '%H:%M:%S'
+CONSOLE_LOG_COLORS = {
+    'DEBUG': 'cyan',
+    'INFO': 'green',
+    'WARNING': 'yellow',
+    'ERROR': 'red',
+    'CRITICAL': 'red,bg_white',
+}
+
+
+class JSONLogFormatter(logging.Formatter):
+    """
+    Compact one-object-per-line JSON formatter for log files.
+    
+    Skips %-style message templating and strftime; the timestamp is the
+    record's epoch time. Serialized with orjson when installed.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as a single JSON line."""
+        entry = {
+            'timestamp': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(entry, default=str).decode()
+        return json.dumps(entry, default=str)
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that passes records through unformatted.
+    
+    The stock prepare() merges the message and drops exc_info so records can
+    be pickled; this queue never leaves the process, so the listener's
+    handlers get the record as logged and format exceptions themselves.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a shallow copy so handlers on this side never see changes."""
+        return copy.copy(record)
+
+
+# Formatters are stateless, so handlers share these instead of rebuilding
+# them every time logging is (re)initialized
+_COLORED_FORMATTER = colorlog.ColoredFormatter(
+    CONSOLE_LOG_FORMAT,
+    datefmt=CONSOLE_DATE_FORMAT,
+    log_colors=CONSOLE_LOG_COLORS
+)
+_PLAIN_CONSOLE_FORMATTER = logging.Formatter(CONSOLE_PLAIN_FORMAT, datefmt=CONSOLE_DATE_FORMAT)
+_DEFAULT_FILE_FORMATTER = logging.Formatter(DEFAULT_LOG_FORMAT, datefmt=DEFAULT_DATE_FORMAT)
+_JSON_FORMATTER = JSONLogFormatter()
+
 
 class LoggingManager:
     """Manages logging configuration for EFIS Data Manager components."""
@@ -26,6 +105,18 @@ class LoggingManager:
         self.component_name = component_name
         self.config = config or {}
         self._loggers = {}
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        
+        # Resolve logging settings once; handler construction reuses them
+        logging_config = self.config.get('logging', {})
+        self._max_bytes = logging_config.get('maxBytes', DEFAULT_MAX_BYTES)
+        self._backup_count = logging_config.get('backupCount', DEFAULT_BACKUP_COUNT)
+        self._log_format = logging_config.get('format', DEFAULT_LOG_FORMAT)
+        self._date_format = logging_config.get('dateFormat', DEFAULT_DATE_FORMAT)
+        self._json_format = logging_config.get('json', False)
+        self._color = logging_config.get('color', 'auto')
+        level_str = logging_config.get('logLevel', 'INFO')
+        self._log_level = getattr(logging, level_str.upper(), logging.INFO)
         
     def setup_logging(self, log_dir: Optional[str] = None) -> logging.Logger:
         """
@@ -43,19 +134,29 @@ class LoggingManager:
         else:
             log_path = self._get_default_log_dir()
             
-        # Ensure log directory exists
+        # Ensure log directory exists; checked on every setup since log
+        # directories can be removed while the process runs
         log_path.mkdir(parents=True, exist_ok=True)
         
         # Configure root logger
         logger = logging.getLogger(self.component_name)
-        logger.setLevel(self._get_log_level())
+        logger.setLevel(self._log_level)
         
         # Clear existing handlers
         logger.handlers.clear()
+        self.stop_logging()
         
-        # Add file handler with rotation
+        # Add file handler with rotation; records are queued and written by
+        # a background listener so callers never wait on disk I/O
         file_handler = self._create_file_handler(log_path)
-        logger.addHandler(file_handler)
+        log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.unregister(self.stop_logging)  # Avoid duplicates on re-setup
+        atexit.register(self.stop_logging)
+        logger.addHandler(_RecordQueueHandler(log_queue))
         
         # Add console handler with colors
         console_handler = self._create_console_handler()
@@ -69,6 +170,14 @@ class LoggingManager:
         
         return logger
         
+    def stop_logging(self) -> None:
+        """Flush queued records to the log file and stop the background writer."""
+        if self._listener:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+            
     def get_logger(self, name: str = None) -> logging.Logger:
         """
         Get a logger instance.
@@ -85,10 +194,12 @@ class LoggingManager:
         if name in self._loggers:
             return self._loggers[name]
         else:
-            # Create child logger
+            # Create child logger, remembering it for subsequent lookups
             parent_logger = self._loggers.get(self.component_name)
             if parent_logger:
-                return parent_logger.getChild(name)
+                logger = parent_logger.getChild(name)
+                self._loggers[name] = logger
+                return logger
             else:
                 return logging.getLogger(name)
                 
@@ -96,52 +207,51 @@ class LoggingManager:
         """Create rotating file handler."""
         log_file = log_path / f"{self.component_name}.log"
         
-        # Get rotation settings from config
-        max_bytes = self.config.get('logging', {}).get('maxBytes', 10 * 1024 * 1024)  # 10MB
-        backup_count = self.config.get('logging', {}).get('backupCount', 5)
-        
         handler = logging.handlers.RotatingFileHandler(
             log_file,
-            maxBytes=max_bytes,
-            backupCount=backup_count,
+            maxBytes=self._max_bytes,
+            backupCount=self._backup_count,
             encoding='utf-8'
         )
         
-        # Set formatter
-        formatter = logging.Formatter(
-            fmt=self.config.get('logging', {}).get('format', 
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
-            datefmt=self.config.get('logging', {}).get('dateFormat', 
-                '%Y-%m-%d %H:%M:%S')
-        )
+        # Set formatter (structured JSON lines when enabled in config)
+        if self._json_format:
+            formatter = _JSON_FORMATTER
+        elif self._log_format == DEFAULT_LOG_FORMAT and self._date_format == DEFAULT_DATE_FORMAT:
+            formatter = _DEFAULT_FILE_FORMATTER
+        else:
+            formatter = logging.Formatter(fmt=self._log_format, datefmt=self._date_format)
         handler.setFormatter(formatter)
         
         return handler
         
     def _create_console_handler(self) -> logging.Handler:
-        """Create colored console handler."""
-        handler = colorlog.StreamHandler(sys.stdout)
+        """Create console handler, colored only when writing to a terminal."""
+        if not self._use_color():
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(_PLAIN_CONSOLE_FORMATTER)
+            return handler
         
-        # Set colored formatter
-        formatter = colorlog.ColoredFormatter(
-            '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%H:%M:%S',
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'green',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red,bg_white',
-            }
-        )
-        handler.setFormatter(formatter)
+        handler = colorlog.StreamHandler(sys.stdout)
+        handler.setFormatter(_COLORED_FORMATTER)
         
         return handler
         
-    def _get_log_level(self) -> int:
-        """Get log level from configuration."""
-        level_str = self.config.get('logging', {}).get('logLevel', 'INFO')
-        return getattr(logging, level_str.upper(), logging.INFO)
+    def _use_color(self) -> bool:
+        """
+        Decide whether console output should carry ANSI colors.
+        
+        The 'color' logging setting may be true, false or 'auto'. In auto mode
+        colors are used only on a TTY and when NO_COLOR is not set.
+        """
+        if self._color != 'auto':
+            return bool(self._color)
+        if os.environ.get('NO_COLOR'):
+            return False
+        try:
+            return sys.stdout.isatty()
+        except (AttributeError, ValueError):
+            return False  # Replaced or closed stdout (e.g. Windows service)
         
     def _get_default_log_dir(self) -> Path:
         """Get default log directory based on platform and component."""
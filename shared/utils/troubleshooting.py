@@ -3,13 +3,217 @@ Troubleshooting utilities for EFIS Data Manager.
 """
 
 import os
+import re
+import copy
+import errno
+import json
 import sys
+import time
+import socket
 import platform
+import selectors
+import shutil
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait as wait_futures
+from functools import lru_cache, wraps
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    yaml = None
+    YAML_AVAILABLE = False
+
+
+# Known ImDisk MountImg.exe install locations
+IMDISK_PATHS = (
+    'C:\\Program Files\\ImDisk\\MountImg.exe',
+    'C:\\Program Files (x86)\\ImDisk\\MountImg.exe'
+)
+
+
+# Shared keyword arguments for diagnostic subprocesses: no stdin, captured
+# output, a bounded runtime and, on Windows, no flashing console window
+_RUN_KWARGS: Dict[str, Any] = {
+    'stdin': subprocess.DEVNULL,
+    'capture_output': True,
+    'timeout': 5
+}
+if sys.platform == 'win32':
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _RUN_KWARGS['startupinfo'] = _STARTUPINFO
+    _RUN_KWARGS['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+
+# Per-platform locations inspected by the diagnostics checks
+DISK_PATHS = {
+    'windows': ('C:\\', 'E:\\'),  # System drive and virtual EFIS drive
+    'darwin': ('/', '/Volumes')
+}
+LOG_PATHS = {
+    'windows': ('C:\\Scripts\\efis-data-manager.log', 'C:\\Scripts\\MountEFIS.log'),
+    'darwin': ('/var/log/efis-daemon.log', '~/Library/Logs/efis-data-manager.log')
+}
+CONFIG_PATHS = {
+    'windows': ('config/windows-config.json', 'C:/Scripts/efis-config.json'),
+    'darwin': ('config/macos-config.yaml', '~/.efis/config.yaml')
+}
+
+
+# Hosts probed by the connectivity check: (host, TCP port)
+CONNECTIVITY_TEST_HOSTS = (
+    ('8.8.8.8', 53),
+    ('google.com', 443)
+)
+
+# connect_ex() results meaning a non-blocking connect is under way (or done)
+_CONNECT_STARTED = frozenset({
+    0, errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, 'WSAEWOULDBLOCK', errno.EWOULDBLOCK)
+})
+
+# Seconds between checks for finished name lookups while connects are open
+_RESOLVE_POLL_INTERVAL = 0.05
+
+
+# Multiplier converting byte counts from shutil.disk_usage to GiB
+_INV_GB = 1.0 / (1 << 30)
+
+
+# Recommendation thresholds: disk usage percent (highest first), log error
+# count and seconds without log activity
+_DISK_THRESHOLDS = (
+    (90.0, 'Critical', 'Free up disk space.'),
+    (80.0, 'Warning', 'Consider freeing up space.')
+)
+_LOG_ERROR_THRESHOLD = 10
+_STALE_LOG_SECONDS = 24 * 60 * 60
+
+
+# Keywords counted by log analysis (matched on raw bytes, any case)
+_LOG_SEVERITY_RE = re.compile(rb'error|warning', re.IGNORECASE)
+_LOG_ERROR_RE = re.compile(rb'error', re.IGNORECASE)
+
+
+def _try_stat(path: str) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it does not exist or is inaccessible."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _read_tail_lines(path: str, max_lines: int, block_size: int = 8192) -> List[bytes]:
+    """
+    Read the last max_lines lines of a file without reading the whole file.
+    
+    Blocks are read backwards from the end, doubling in size, until enough
+    line breaks have been seen. Lines are returned undecoded.
+    """
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b''
+        while position > 0 and data.count(b'\n') <= max_lines:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+            block_size *= 2
+    
+    lines = data.splitlines()
+    if position > 0:
+        lines = lines[1:]  # First line may start mid-line
+    
+    return lines[-max_lines:]
+
+
+def _classify_log_line(line: bytes) -> Optional[str]:
+    """
+    Classify a raw log line as 'error', 'warning' or None.
+    
+    A line mentioning both counts as an error. Lines with neither keyword,
+    the common case, are rejected in a single case-insensitive scan.
+    """
+    match = _LOG_SEVERITY_RE.search(line)
+    if match is None:
+        return None
+    if match.group().lower() == b'error' or _LOG_ERROR_RE.search(line, match.end()):
+        return 'error'
+    return 'warning'
+
+
+@lru_cache(maxsize=32)
+def _parse_config_file(path: str, mtime_ns: int) -> Optional[str]:
+    """
+    Parse a JSON or YAML configuration file and report why it is invalid.
+    
+    Keyed on the file's modification time so unchanged files are only
+    parsed once. Returns None when the file parses cleanly.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        
+        if path.endswith('.json'):
+            if ORJSON_AVAILABLE:
+                orjson.loads(data)
+            else:
+                json.loads(data)
+        elif path.endswith('.yaml') and YAML_AVAILABLE:
+            yaml.load(data, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+    except Exception as e:
+        return str(e)
+    
+    return None
+
+
+def _module_available(name: str) -> bool:
+    """
+    Check if a module can be imported, without executing it.
+    
+    Not cached here; SystemDiagnostics caches the whole module check with
+    a TTL so a module installed while running is picked up.
+    """
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _ttl_cache(seconds: float):
+    """
+    Cache a SystemDiagnostics method's result for the given number of seconds.
+    
+    Results are stored per instance, so SystemDiagnostics.clear_cache() forces
+    every cached section to be recomputed. Callers always get their own deep
+    copy, so editing a returned report never changes the cached one.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args):
+            key = (method.__name__, args)
+            now = time.monotonic()
+            cached = self._section_cache.get(key)
+            if cached is not None and now - cached[0] < seconds:
+                return copy.deepcopy(cached[1])
+            
+            result = method(self, *args)
+            self._section_cache[key] = (now, copy.deepcopy(result))
+            return result
+        return wrapper
+    return decorator
 
 
 class SystemDiagnostics:
@@ -19,27 +223,58 @@ class SystemDiagnostics:
         """Initialize diagnostics."""
         self.logger = logger or logging.getLogger(__name__)
         self.platform = platform.system().lower()
+        self._imdisk_path: Optional[str] = None
+        self._section_cache: Dict[tuple, tuple] = {}
+        
+        # Resolve the platform's paths once; every run reuses them
+        self._disk_paths = DISK_PATHS.get(self.platform, ())
+        self._log_paths = tuple(os.path.expanduser(p) for p in LOG_PATHS.get(self.platform, ()))
+        self._config_paths = tuple(os.path.expanduser(p) for p in CONFIG_PATHS.get(self.platform, ()))
+    
+    def clear_cache(self) -> None:
+        """Discard cached diagnostics sections so the next run recomputes them."""
+        self._section_cache.clear()
     
     def run_full_diagnostics(self) -> Dict[str, Any]:
-        """Run comprehensive system diagnostics."""
-        diagnostics = {
-            'timestamp': datetime.now().isoformat(),
-            'platform': self.platform,
-            'system_info': self._get_system_info(),
-            'python_info': self._get_python_info(),
-            'disk_space': self._check_disk_space(),
-            'network_connectivity': self._check_network_connectivity(),
-            'process_status': self._check_processes(),
-            'log_analysis': self._analyze_logs(),
-            'configuration_check': self._check_configuration(),
-            'recommendations': []
+        """
+        Run comprehensive system diagnostics.
+        
+        The individual checks are independent and mostly wait on external
+        commands, so they run concurrently; recommendations are generated
+        once all results are in.
+        """
+        checks = {
+            'system_info': self._get_system_info,
+            'python_info': self._get_python_info,
+            'disk_space': self._check_disk_space,
+            'network_connectivity': self._check_network_connectivity,
+            'process_status': self._check_processes,
+            'log_analysis': self._analyze_logs,
+            'configuration_check': self._check_configuration
         }
         
         # Add platform-specific checks
+        platform_checks = {}
         if self.platform == 'windows':
-            diagnostics['windows_specific'] = self._windows_diagnostics()
+            platform_checks['windows_specific'] = self._windows_diagnostics
         elif self.platform == 'darwin':
-            diagnostics['macos_specific'] = self._macos_diagnostics()
+            platform_checks['macos_specific'] = self._macos_diagnostics
+        
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix="diagnostics") as executor:
+            futures = {
+                name: executor.submit(check)
+                for name, check in {**checks, **platform_checks}.items()
+            }
+        
+        diagnostics = {
+            'timestamp': datetime.now().isoformat(),
+            'platform': self.platform
+        }
+        for name in checks:
+            diagnostics[name] = futures[name].result()
+        diagnostics['recommendations'] = []
+        for name in platform_checks:
+            diagnostics[name] = futures[name].result()
         
         # Generate recommendations based on findings
         diagnostics['recommendations'] = self._generate_recommendations(diagnostics)
@@ -47,15 +282,22 @@ class SystemDiagnostics:
         return diagnostics
     
     def _get_system_info(self) -> Dict[str, Any]:
-        """Get basic system information."""
+        """Get basic system information, with uptime read fresh each time."""
+        system_info = self._get_platform_info()
+        if 'error' not in system_info:
+            system_info['uptime'] = self._get_uptime()
+        return system_info
+    
+    @_ttl_cache(300)
+    def _get_platform_info(self) -> Dict[str, Any]:
+        """Get the platform details, which do not change while running."""
         try:
             return {
                 'platform': platform.platform(),
                 'machine': platform.machine(),
                 'processor': platform.processor(),
                 'python_version': platform.python_version(),
-                'hostname': platform.node(),
-                'uptime': self._get_uptime()
+                'hostname': platform.node()
             }
         except Exception as e:
             return {'error': str(e)}
@@ -72,6 +314,7 @@ class SystemDiagnostics:
         except Exception as e:
             return {'error': str(e)}
     
+    @_ttl_cache(3600)
     def _check_required_modules(self) -> Dict[str, bool]:
         """Check if required Python modules are available."""
         required_modules = [
@@ -83,63 +326,26 @@ class SystemDiagnostics:
         if self.platform == 'windows':
             required_modules.extend(['win32serviceutil', 'win32service', 'win32event'])
         
-        module_status = {}
-        for module in required_modules:
-            try:
-                __import__(module)
-                module_status[module] = True
-            except ImportError:
-                module_status[module] = False
-        
-        return module_status
+        return {module: _module_available(module) for module in required_modules}
     
     def _check_disk_space(self) -> Dict[str, Any]:
         """Check disk space on relevant drives."""
         try:
             disk_info = {}
             
-            if self.platform == 'windows':
-                # Check C: drive and any configured drives
-                drives = ['C:\\']
-                
-                # Add configured drive letters if available
+            for path in self._disk_paths:
                 try:
-                    # This would read from config if available
-                    drives.append('E:\\')  # Virtual drive
-                except:
-                    pass
-                
-                for drive in drives:
-                    if os.path.exists(drive):
-                        try:
-                            import shutil
-                            total, used, free = shutil.disk_usage(drive)
-                            disk_info[drive] = {
-                                'total_gb': total / (1024**3),
-                                'used_gb': used / (1024**3),
-                                'free_gb': free / (1024**3),
-                                'usage_percent': (used / total) * 100
-                            }
-                        except Exception as e:
-                            disk_info[drive] = {'error': str(e)}
-            
-            elif self.platform == 'darwin':
-                # Check root and common mount points
-                mount_points = ['/', '/Volumes']
-                
-                for mount_point in mount_points:
-                    if os.path.exists(mount_point):
-                        try:
-                            import shutil
-                            total, used, free = shutil.disk_usage(mount_point)
-                            disk_info[mount_point] = {
-                                'total_gb': total / (1024**3),
-                                'used_gb': used / (1024**3),
-                                'free_gb': free / (1024**3),
-                                'usage_percent': (used / total) * 100
-                            }
-                        except Exception as e:
-                            disk_info[mount_point] = {'error': str(e)}
+                    total, used, free = shutil.disk_usage(path)
+                    disk_info[path] = {
+                        'total_gb': total * _INV_GB,
+                        'used_gb': used * _INV_GB,
+                        'free_gb': free * _INV_GB,
+                        'usage_percent': used * 100.0 / total if total else 0.0
+                    }
+                except OSError:
+                    continue  # Drive or mount point not present
+                except Exception as e:
+                    disk_info[path] = {'error': str(e)}
             
             return disk_info
             
@@ -147,40 +353,135 @@ class SystemDiagnostics:
             return {'error': str(e)}
     
     def _check_network_connectivity(self) -> Dict[str, Any]:
-        """Check network connectivity."""
+        """
+        Check network connectivity.
+        
+        Each test host is probed with a TCP connect; all connects are started
+        at once and awaited together with a selector, so no ping process is
+        spawned. Falls back to ping if sockets cannot be created.
+        """
         try:
-            connectivity = {}
+            try:
+                return self._probe_hosts(CONNECTIVITY_TEST_HOSTS)
+            except PermissionError as e:
+                self.logger.debug(f"TCP probe not permitted, falling back to ping: {e}")
             
-            # Test basic internet connectivity
-            test_hosts = ['8.8.8.8', 'google.com']
+            # Ping all hosts concurrently
+            hosts = [host for host, _ in CONNECTIVITY_TEST_HOSTS]
+            with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+                return dict(zip(hosts, executor.map(self._ping_host, hosts)))
             
-            for host in test_hosts:
+        except Exception as e:
+            return {'error': str(e)}
+    
+    def _probe_hosts(self, hosts, timeout: float = 2.0) -> Dict[str, Any]:
+        """
+        Probe (host, port) pairs with concurrent non-blocking TCP connects.
+        
+        Name lookups run in parallel threads and count against the same
+        timeout; each host's connect starts as soon as its lookup finishes.
+        Every resolved address is tried in turn until one accepts, so an
+        unroutable IPv6 address does not hide a working IPv4 one.
+        """
+        connectivity = {}
+        addresses = {}
+        pending = {}
+        selector = selectors.DefaultSelector()
+        deadline = time.monotonic() + timeout
+        
+        def connect_next(host: str) -> bool:
+            """Start a connect to the host's next address; False once none are left."""
+            while addresses[host]:
+                family, sock_type, proto, _, address = addresses[host].pop(0)
                 try:
-                    if self.platform == 'windows':
-                        result = subprocess.run(
-                            ['ping', '-n', '1', host],
-                            capture_output=True,
-                            timeout=5
-                        )
-                    else:
-                        result = subprocess.run(
-                            ['ping', '-c', '1', host],
-                            capture_output=True,
-                            timeout=5
-                        )
-                    
-                    connectivity[host] = {
-                        'reachable': result.returncode == 0,
-                        'response_time': 'success' if result.returncode == 0 else 'failed'
-                    }
-                    
-                except subprocess.TimeoutExpired:
-                    connectivity[host] = {'reachable': False, 'response_time': 'timeout'}
-                except Exception as e:
-                    connectivity[host] = {'error': str(e)}
+                    sock = socket.socket(family, sock_type, proto)
+                except PermissionError:
+                    raise
+                except OSError:
+                    continue  # Address family not supported here
+                
+                sock.setblocking(False)
+                if sock.connect_ex(address) not in _CONNECT_STARTED:
+                    sock.close()
+                    continue
+                selector.register(sock, selectors.EVENT_WRITE, host)
+                pending[host] = sock
+                return True
+            return False
+        
+        # getaddrinfo() has no timeout of its own; lookups still running at
+        # the deadline are abandoned to their threads
+        resolver = ThreadPoolExecutor(max_workers=len(hosts), thread_name_prefix="resolve")
+        try:
+            lookups = {
+                host: resolver.submit(socket.getaddrinfo, host, port, type=socket.SOCK_STREAM)
+                for host, port in hosts
+            }
             
-            return connectivity
+            while lookups or pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                for host, lookup in list(lookups.items()):
+                    if not lookup.done():
+                        continue
+                    del lookups[host]
+                    try:
+                        addresses[host] = lookup.result()
+                    except OSError as e:
+                        connectivity[host] = {'reachable': False, 'response_time': 'failed', 'error': str(e)}
+                        continue
+                    if not connect_next(host):
+                        connectivity[host] = {'reachable': False, 'response_time': 'failed'}
+                
+                # Wake up periodically while lookups are still outstanding
+                wait = min(remaining, _RESOLVE_POLL_INTERVAL) if lookups else remaining
+                if not pending:
+                    if lookups:
+                        wait_futures(lookups.values(), wait, return_when=FIRST_COMPLETED)
+                    continue
+                
+                for key, _ in selector.select(wait):
+                    host = key.data
+                    sock = pending.pop(host)
+                    selector.unregister(sock)
+                    reachable = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                    sock.close()
+                    if reachable or not connect_next(host):
+                        connectivity[host] = {
+                            'reachable': reachable,
+                            'response_time': 'success' if reachable else 'failed'
+                        }
+            
+            for host in (*lookups, *pending):
+                connectivity[host] = {'reachable': False, 'response_time': 'timeout'}
+        
+        finally:
+            resolver.shutdown(wait=False)
+            for sock in pending.values():
+                sock.close()
+            selector.close()
+        
+        # Preserve the configured host order
+        return {host: connectivity[host] for host, _ in hosts}
+    
+    def _ping_host(self, host: str) -> Dict[str, Any]:
+        """Ping a host once and report whether it answered."""
+        try:
+            count_flag = '-n' if self.platform == 'windows' else '-c'
+            result = subprocess.run(
+                ['ping', count_flag, '1', host],
+                **_RUN_KWARGS
+            )
+            
+            return {
+                'reachable': result.returncode == 0,
+                'response_time': 'success' if result.returncode == 0 else 'failed'
+            }
             
+        except subprocess.TimeoutExpired:
+            return {'reachable': False, 'response_time': 'timeout'}
         except Exception as e:
             return {'error': str(e)}
     
@@ -197,8 +498,8 @@ class SystemDiagnostics:
                     try:
                         result = subprocess.run(
                             ['tasklist', '/FI', f'IMAGENAME eq {process_name}'],
-                            capture_output=True,
-                            text=True
+                            text=True,
+                            **_RUN_KWARGS
                         )
                         
                         processes[process_name] = {
@@ -217,8 +518,8 @@ class SystemDiagnostics:
                     try:
                         result = subprocess.run(
                             ['pgrep', '-f', process_name],
-                            capture_output=True,
-                            text=True
+                            text=True,
+                            **_RUN_KWARGS
                         )
                         
                         processes[process_name] = {
@@ -244,42 +545,30 @@ class SystemDiagnostics:
                 'last_activity': None
             }
             
-            # Common log locations
-            log_paths = []
-            
-            if self.platform == 'windows':
-                log_paths = [
-                    'C:\\Scripts\\efis-data-manager.log',
-                    'C:\\Scripts\\MountEFIS.log'
-                ]
-            elif self.platform == 'darwin':
-                log_paths = [
-                    '/var/log/efis-daemon.log',
-                    os.path.expanduser('~/Library/Logs/efis-data-manager.log')
-                ]
-            
-            for log_path in log_paths:
-                if os.path.exists(log_path):
+            for log_path in self._log_paths:
+                st = _try_stat(log_path)
+                if st is not None:
                     try:
                         # Read last 100 lines
-                        with open(log_path, 'r') as f:
-                            lines = f.readlines()[-100:]
+                        lines = _read_tail_lines(log_path, 100)
                         
                         for line in lines:
-                            line_lower = line.lower()
-                            if 'error' in line_lower:
+                            severity = _classify_log_line(line)
+                            if severity == 'error':
                                 log_analysis['error_count'] += 1
                                 if len(log_analysis['recent_errors']) < 5:
-                                    log_analysis['recent_errors'].append(line.strip())
-                            elif 'warning' in line_lower:
+                                    log_analysis['recent_errors'].append(
+                                        line.decode('utf-8', errors='replace').strip()
+                                    )
+                            elif severity == 'warning':
                                 log_analysis['warning_count'] += 1
                         
                         # Get last modification time
-                        mtime = os.path.getmtime(log_path)
-                        last_modified = datetime.fromtimestamp(mtime)
+                        mtime = st.st_mtime
                         
-                        if not log_analysis['last_activity'] or last_modified > log_analysis['last_activity']:
-                            log_analysis['last_activity'] = last_modified.isoformat()
+                        if mtime > log_analysis.get('last_activity_ts', 0.0):
+                            log_analysis['last_activity'] = datetime.fromtimestamp(mtime).isoformat()
+                            log_analysis['last_activity_ts'] = mtime
                     
                     except Exception as e:
                         log_analysis[f'log_error_{log_path}'] = str(e)
@@ -289,6 +578,7 @@ class SystemDiagnostics:
         except Exception as e:
             return {'error': str(e)}
     
+    @_ttl_cache(30)
     def _check_configuration(self) -> Dict[str, Any]:
         """Check configuration files."""
         try:
@@ -299,36 +589,16 @@ class SystemDiagnostics:
                 'issues': []
             }
             
-            # Common config locations
-            config_paths = []
-            
-            if self.platform == 'windows':
-                config_paths = [
-                    'config/windows-config.json',
-                    'C:/Scripts/efis-config.json'
-                ]
-            elif self.platform == 'darwin':
-                config_paths = [
-                    'config/macos-config.yaml',
-                    os.path.expanduser('~/.efis/config.yaml')
-                ]
-            
-            for config_path in config_paths:
-                if os.path.exists(config_path):
+            for config_path in self._config_paths:
+                st = _try_stat(config_path)
+                if st is not None:
                     config_check['files_found'].append(config_path)
                     
                     # Basic validation
-                    try:
-                        if config_path.endswith('.json'):
-                            import json
-                            with open(config_path, 'r') as f:
-                                json.load(f)
-                        elif config_path.endswith('.yaml'):
-                            # Would use yaml.load if available
-                            pass
-                    except Exception as e:
+                    error = _parse_config_file(config_path, st.st_mtime_ns)
+                    if error:
                         config_check['configuration_valid'] = False
-                        config_check['issues'].append(f"Invalid config {config_path}: {e}")
+                        config_check['issues'].append(f"Invalid config {config_path}: {error}")
                 else:
                     config_check['files_missing'].append(config_path)
             
@@ -337,25 +607,21 @@ class SystemDiagnostics:
         except Exception as e:
             return {'error': str(e)}
     
+    @_ttl_cache(60)
     def _windows_diagnostics(self) -> Dict[str, Any]:
         """Windows-specific diagnostics."""
         try:
             windows_info = {}
             
             # Check ImDisk installation
-            imdisk_paths = [
-                'C:\\Program Files\\ImDisk\\MountImg.exe',
-                'C:\\Program Files (x86)\\ImDisk\\MountImg.exe'
-            ]
-            
-            windows_info['imdisk_installed'] = any(os.path.exists(path) for path in imdisk_paths)
+            windows_info['imdisk_installed'] = self._find_imdisk() is not None
             
             # Check Windows services
             try:
                 result = subprocess.run(
                     ['sc', 'query', 'EFISDataManager'],
-                    capture_output=True,
-                    text=True
+                    text=True,
+                    **_RUN_KWARGS
                 )
                 windows_info['service_installed'] = result.returncode == 0
                 windows_info['service_status'] = result.stdout if result.returncode == 0 else 'Not installed'
@@ -366,8 +632,7 @@ class SystemDiagnostics:
             try:
                 result = subprocess.run(
                     ['schtasks', '/query', '/tn', 'MountEFIS'],
-                    capture_output=True,
-                    text=True
+                    **_RUN_KWARGS
                 )
                 windows_info['scheduled_task_exists'] = result.returncode == 0
             except Exception as e:
@@ -378,6 +643,16 @@ class SystemDiagnostics:
         except Exception as e:
             return {'error': str(e)}
     
+    def _find_imdisk(self) -> Optional[str]:
+        """Locate MountImg.exe, remembering the path once found."""
+        if self._imdisk_path is None:
+            for path in IMDISK_PATHS:
+                if os.path.isfile(path):
+                    self._imdisk_path = path
+                    break
+        return self._imdisk_path
+    
+    @_ttl_cache(60)
     def _macos_diagnostics(self) -> Dict[str, Any]:
         """macOS-specific diagnostics."""
         try:
@@ -387,8 +662,8 @@ class SystemDiagnostics:
             try:
                 result = subprocess.run(
                     ['launchctl', 'list', 'com.efis-data-manager.daemon'],
-                    capture_output=True,
-                    text=True
+                    text=True,
+                    **_RUN_KWARGS
                 )
                 macos_info['daemon_loaded'] = result.returncode == 0
                 macos_info['daemon_status'] = result.stdout if result.returncode == 0 else 'Not loaded'
@@ -397,7 +672,7 @@ class SystemDiagnostics:
             
             # Check USB monitoring
             try:
-                result = subprocess.run(['df', '-h'], capture_output=True, text=True)
+                result = subprocess.run(['df', '-h'], text=True, **_RUN_KWARGS)
                 usb_drives = []
                 if result.returncode == 0:
                     for line in result.stdout.split('\n'):
@@ -418,13 +693,13 @@ class SystemDiagnostics:
             if self.platform == 'windows':
                 result = subprocess.run(
                     ['wmic', 'os', 'get', 'LastBootUpTime'],
-                    capture_output=True,
-                    text=True
+                    text=True,
+                    **_RUN_KWARGS
                 )
                 if result.returncode == 0:
                     return result.stdout.strip()
             elif self.platform == 'darwin':
-                result = subprocess.run(['uptime'], capture_output=True, text=True)
+                result = subprocess.run(['uptime'], text=True, **_RUN_KWARGS)
                 if result.returncode == 0:
                     return result.stdout.strip()
             
@@ -440,11 +715,13 @@ class SystemDiagnostics:
         # Check disk space
         disk_space = diagnostics.get('disk_space', {})
         for drive, info in disk_space.items():
-            if isinstance(info, dict) and 'usage_percent' in info:
-                if info['usage_percent'] > 90:
-                    recommendations.append(f"Critical: {drive} is {info['usage_percent']:.1f}% full. Free up disk space.")
-                elif info['usage_percent'] > 80:
-                    recommendations.append(f"Warning: {drive} is {info['usage_percent']:.1f}% full. Consider freeing up space.")
+            usage = info.get('usage_percent') if isinstance(info, dict) else None
+            if usage is None:
+                continue
+            for threshold, level, advice in _DISK_THRESHOLDS:
+                if usage > threshold:
+                    recommendations.append(f"{level}: {drive} is {usage:.1f}% full. {advice}")
+                    break
         
         # Check network connectivity
         network = diagnostics.get('network_connectivity', {})
@@ -458,17 +735,12 @@ class SystemDiagnostics:
         log_analysis = diagnostics.get('log_analysis', {})
         if isinstance(log_analysis, dict):
             error_count = log_analysis.get('error_count', 0)
-            if error_count > 10:
+            if error_count > _LOG_ERROR_THRESHOLD:
                 recommendations.append(f"High error count in logs ({error_count} errors). Check log files for details.")
             
-            last_activity = log_analysis.get('last_activity')
-            if last_activity:
-                try:
-                    last_time = datetime.fromisoformat(last_activity)
-                    if datetime.now() - last_time > timedelta(hours=24):
-                        recommendations.append("No recent log activity detected. System may not be running.")
-                except:
-                    pass
+            last_activity_ts = log_analysis.get('last_activity_ts')
+            if last_activity_ts and time.time() - last_activity_ts > _STALE_LOG_SECONDS:
+                recommendations.append("No recent log activity detected. System may not be running.")
         
         # Platform-specific recommendations
         if self.platform == 'windows':
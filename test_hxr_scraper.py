@@ -5,12 +5,9 @@ Quick test to verify HXr and Mini A/P software scraping works correctly.
 
 import sys
 import logging
-from pathlib import Path
+from functools import lru_cache
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent / "macos" / "src"))
-
-from efis_macos.grt_scraper import GRTWebScraper
+from macos.src.efis_macos.grt_scraper import GRTWebScraper
 
 # Setup logging
 logging.basicConfig(
@@ -18,12 +15,17 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+@lru_cache(maxsize=None)
+def get_scraper() -> GRTWebScraper:
+    """Return one scraper for all checks so they share its HTTP session and page cache."""
+    return GRTWebScraper()
+
 def test_hxr_scraping():
     """Test HXr software scraping."""
     print("Testing HXr software scraping...")
     print("-" * 60)
     
-    scraper = GRTWebScraper()
+    scraper = get_scraper()
     
     # Test with the product page URL
     hxr_url = "https://grtavionics.com/product/horizon-hxr-efis/"
@@ -48,7 +50,7 @@ def test_mini_ap_scraping():
     print("\n\nTesting Mini A/P software scraping...")
     print("-" * 60)
     
-    scraper = GRTWebScraper()
+    scraper = get_scraper()
     
     # Test with the product page URL
     mini_ap_url = "https://grtavionics.com/product/mini-ap-efis/"
@@ -73,7 +75,7 @@ def test_ahrs_scraping():
     print("\n\nTesting AHRS software scraping...")
     print("-" * 60)
     
-    scraper = GRTWebScraper()
+    scraper = get_scraper()
     
     # Test with the product page URL (same as Mini A/P)
     ahrs_url = "https://grtavionics.com/product/mini-ap-efis/"
@@ -98,7 +100,7 @@ def test_servo_scraping():
     print("\n\nTesting Servo software scraping...")
     print("-" * 60)
     
-    scraper = GRTWebScraper()
+    scraper = get_scraper()
     
     # Test with the direct download URL
     servo_url = "https://grtavionics.com/getfile.aspx/servo/ServoUp14.dat"
@@ -0,0 +1,160 @@
+"""
+Shared fixtures for the integration tests.
+"""
+
+import copy
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+
+# Workflow configuration with every path relative to the test's own temp dir,
+# so tests running side by side (pytest -n auto) never share a location.
+WORKFLOW_CONFIG_TEMPLATE = {
+    'windows': {
+        'virtualDriveFile': 'virtual.vhd',
+        'driveLetter': 'E:',
+        'syncInterval': 1800,
+        'retryAttempts': 3
+    },
+    'macos': {
+        'archivePath': 'archive',
+        'demoPath': 'demo',
+        'logbookPath': 'logbook',
+        'checkInterval': 3600
+    },
+    'logging': {
+        'logLevel': 'INFO',
+        'maxBytes': 1048576,
+        'backupCount': 3
+    }
+}
+
+# Directories every workflow test starts with, relative to its temp dir
+WORKFLOW_DIRS = ('archive', 'demo', 'logbook')
+
+# Remove test dirs with a background rm -rf instead of blocking teardown;
+# set EFIS_TEST_ASYNC_CLEANUP=0 to delete synchronously
+ASYNC_CLEANUP = os.environ.get('EFIS_TEST_ASYNC_CLEANUP', '1') != '0'
+
+_pending_cleanups = []
+
+# Timing limits (seconds) for the performance tests; a measurement fails
+# once it exceeds its entry times PERF_TOLERANCE. The entries are the former
+# hard-coded 10s/5s limits moved into a file, not measured timings: measured
+# runs take milliseconds, far too noisy for a tight multiplier
+PERF_BASELINE_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'perf_baseline.json')
+PERF_TOLERANCE = 1.0
+
+# Workflow fixtures never need to survive a reboot, so keep them in RAM
+# where a tmpfs is available (Linux)
+FIXTURE_TMP_ROOT = (
+    '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+)
+
+PATH_KEYS = {
+    'windows': ('virtualDriveFile',),
+    'macos': ('archivePath', 'demoPath', 'logbookPath')
+}
+
+
+@pytest.fixture(scope="session")
+def workflow_config_template():
+    """Build the read-only workflow config once per session (or xdist worker)."""
+    return WORKFLOW_CONFIG_TEMPLATE
+
+
+@pytest.fixture
+def make_workflow_config(workflow_config_template):
+    """Return a factory resolving a private copy of the template under a root dir."""
+    def _make(root):
+        config = copy.deepcopy(workflow_config_template)
+        for section, keys in PATH_KEYS.items():
+            for key in keys:
+                config[section][key] = os.path.join(root, config[section][key])
+        return config
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def perf_baseline():
+    """Load the per-test timing limits once per session."""
+    with open(PERF_BASELINE_FILE, encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def assert_within_baseline(request, perf_baseline):
+    """Return a checker comparing a timing against the current test's baseline."""
+    baselines = perf_baseline.get(request.node.originalname, {})
+
+    def _check(name, elapsed):
+        if name not in baselines:
+            pytest.fail(
+                f"No baseline for {request.node.originalname}/{name} in {PERF_BASELINE_FILE}",
+                pytrace=False
+            )
+        limit = baselines[name] * PERF_TOLERANCE
+        assert elapsed < limit, f"{name} took {elapsed:.3f}s, baseline allows {limit:.3f}s"
+
+    return _check
+
+
+@pytest.fixture(scope="session")
+def workflow_dir_template():
+    """Build the workflow directory skeleton once per session."""
+    template = tempfile.mkdtemp(prefix="workflow_template", dir=FIXTURE_TMP_ROOT)
+    for name in WORKFLOW_DIRS:
+        os.mkdir(os.path.join(template, name))
+
+    yield template
+
+    shutil.rmtree(template, ignore_errors=True)
+
+
+@pytest.fixture
+def workflow_dir(workflow_dir_template):
+    """Give each test a private copy of the workflow skeleton."""
+    temp_dir = tempfile.mkdtemp(dir=FIXTURE_TMP_ROOT)
+    shutil.copytree(workflow_dir_template, temp_dir, dirs_exist_ok=True)
+
+    yield temp_dir
+
+    remove_tree(temp_dir)
+
+
+def remove_tree(path):
+    """Delete a test directory, in the background where supported."""
+    if not ASYNC_CLEANUP or sys.platform == 'win32':
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    # Rename first so the path is free again immediately
+    trash = f"{path}.trash.{os.getpid()}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    try:
+        _pending_cleanups.append(subprocess.Popen(
+            ["rm", "-rf", trash],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        ))
+    except OSError:
+        shutil.rmtree(trash, ignore_errors=True)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Wait for background deletions so no temp dirs outlive the run."""
+    while _pending_cleanups:
+        _pending_cleanups.pop().wait()
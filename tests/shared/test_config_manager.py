@@ -2,7 +2,9 @@
 Unit tests for configuration manager.
 """
 
+import os
 import pytest
+import shutil
 import tempfile
 import yaml
 from pathlib import Path
@@ -12,6 +14,9 @@ from shared.config.config_manager import ConfigManager
 from shared.config.validation import ConfigValidator
 
 
+REPO_CONFIG = Path(__file__).resolve().parents[2] / 'config' / 'efis_config.yaml'
+
+
 class TestConfigManager:
     """Test cases for ConfigManager."""
 
@@ -80,6 +85,88 @@ class TestConfigManager:
         assert self.config_manager.get('new.nested.key') == 'value'
 
 
+class TestConfigManagerLoaded:
+    """Test ConfigManager lookups against a fully loaded configuration."""
+
+    def setup_method(self):
+        """Load a copy of the shipped configuration."""
+        self.temp_dir = tempfile.mkdtemp()
+        config_path = Path(self.temp_dir) / 'efis_config.yaml'
+        shutil.copy(REPO_CONFIG, config_path)
+
+        self.config_manager = ConfigManager()
+        self.config_manager.load_config(str(config_path))
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_get_reflects_config_changes(self):
+        """Test that get() sees changes made through get_config()."""
+        assert self.config_manager.get('logging.backupCount') == 5
+
+        self.config_manager.get_config().logging['backupCount'] = 9
+        assert self.config_manager.get('logging.backupCount') == 9
+
+    def test_get_returns_independent_copies(self):
+        """Test that mutating a returned section does not leak into later lookups."""
+        section = self.config_manager.get('logging')
+        section['backupCount'] = 42
+
+        assert self.config_manager.get('logging.backupCount') == 5
+        assert self.config_manager.get('logging') is not section
+
+    def test_get_missing_key_uses_default(self):
+        """Test that missing keys return the default each time."""
+        assert self.config_manager.get('logging.missing', 'x') == 'x'
+        assert self.config_manager.get('logging.missing') is None
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason="POSIX permissions only")
+class TestConfigFileCache:
+    """Test cases for the parsed config file cache."""
+
+    def setup_method(self):
+        """Copy the shipped configuration into a private directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = Path(self.temp_dir) / 'efis_config.yaml'
+        self.cache_path = Path(self.temp_dir) / '.cache' / 'efis_config.yaml.json'
+        shutil.copy(REPO_CONFIG, self.config_path)
+        self.old_umask = os.umask(0o002)
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        os.umask(self.old_umask)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cache_private_under_permissive_umask(self):
+        """Test that the cache is owner-only and reused with a group-writable umask."""
+        ConfigManager().load_config(str(self.config_path))
+        assert self.cache_path.stat().st_mode & 0o777 == 0o600
+
+        config_manager = ConfigManager()
+        with patch('shared.config.config_manager.yaml.load') as mock_load, \
+             patch.object(config_manager.logger, 'warning') as mock_warning:
+            config_manager.load_config(str(self.config_path))
+
+        mock_load.assert_not_called()
+        mock_warning.assert_not_called()
+        assert config_manager.get('logging.backupCount') == 5
+        assert os.listdir(self.cache_path.parent) == [self.cache_path.name]
+
+    def test_shared_writable_cache_ignored(self):
+        """Test that a cache others could have written is not trusted."""
+        ConfigManager().load_config(str(self.config_path))
+        self.cache_path.chmod(0o666)
+
+        config_manager = ConfigManager()
+        with patch.object(config_manager.logger, 'warning') as mock_warning:
+            config_manager.load_config(str(self.config_path))
+
+        mock_warning.assert_called_once()
+        assert self.cache_path.stat().st_mode & 0o777 == 0o600
+
+
 class TestConfigValidator:
     """Test cases for ConfigValidator."""
 
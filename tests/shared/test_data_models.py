@@ -169,6 +169,37 @@ class TestEFISDrive:
         )
         assert not invalid_drive.is_valid()
 
+    @pytest.mark.parametrize("file_type, expected", [
+        ("demo", ["DEMO-20231201-120000.LOG"]),
+        ("snap", ["SNAP-001.png", "SNAP-002.png"]),
+        ("logbook", ["logbook.csv"]),
+        ("LOGBOOK", ["logbook.csv"]),
+    ])
+    def test_efis_drive_get_files_by_type(self, file_type, expected):
+        """Test looking up each file list by type name, in any case."""
+        drive = EFISDrive(
+            mount_path="/Volumes/EFIS",
+            identifier="EFIS_DRIVE_001",
+            capacity=32000000000,
+            demo_files=["DEMO-20231201-120000.LOG"],
+            snap_files=["SNAP-001.png", "SNAP-002.png"],
+            logbook_files=["logbook.csv"]
+        )
+        
+        assert drive.get_files_by_type(file_type) == expected
+        assert drive.total_files == 4
+
+    def test_efis_drive_get_files_by_unknown_type(self):
+        """Test that an unknown file type yields an empty list."""
+        drive = EFISDrive(
+            mount_path="/Volumes/EFIS",
+            identifier="EFIS_DRIVE_001",
+            capacity=32000000000,
+            demo_files=["DEMO-20231201-120000.LOG"]
+        )
+        
+        assert drive.get_files_by_type("firmware") == []
+
 
 class TestOperationStatus:
     """Test cases for OperationStatus enum."""
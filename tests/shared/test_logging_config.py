@@ -0,0 +1,140 @@
+"""
+Unit tests for logging configuration.
+"""
+
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from shared.utils.logging_config import LoggingManager, JSONLogFormatter, _RecordQueueHandler
+
+
+class TestJSONLogFormatter:
+    """Test cases for JSONLogFormatter."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.formatter = JSONLogFormatter()
+
+    def _record(self, msg, args=(), exc_info=None):
+        """Build a WARNING record as a logger call would."""
+        return logging.LogRecord('efis.test', logging.WARNING, __file__, 1, msg, args, exc_info)
+
+    def test_format_single_json_line(self):
+        """Test that a record becomes one JSON object with its message merged."""
+        record = self._record("Drive %s at %d%%", ('E:', 95))
+
+        line = self.formatter.format(record)
+
+        assert '\n' not in line
+        assert json.loads(line) == {
+            'timestamp': record.created,
+            'level': 'WARNING',
+            'logger': 'efis.test',
+            'message': 'Drive E: at 95%'
+        }
+
+    def test_format_exception(self):
+        """Test that exception details are included only when present."""
+        try:
+            raise RuntimeError("mount failed")
+        except RuntimeError:
+            record = self._record("Mount error", exc_info=sys.exc_info())
+
+        entry = json.loads(self.formatter.format(record))
+        assert 'RuntimeError: mount failed' in entry['exception']
+        assert 'exception' not in json.loads(self.formatter.format(self._record("ok")))
+
+
+class TestLoggingManager:
+    """Test cases for LoggingManager."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = LoggingManager('test_component', {'logging': {'json': True}})
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.manager.stop_logging()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _read_entries(self):
+        """Stop the background writer and return the JSON lines written."""
+        self.manager.stop_logging()
+        log_file = Path(self.temp_dir) / 'test_component.log'
+        return [json.loads(line) for line in log_file.read_text(encoding='utf-8').splitlines()]
+
+    def test_json_log_keeps_exception(self):
+        """Test that exceptions logged through the queue reach the JSON file."""
+        logger = self.manager.setup_logging(self.temp_dir)
+
+        try:
+            raise ValueError("bad drive")
+        except ValueError:
+            logger.exception("Sync failed for %s", "E:")
+
+        entry = self._read_entries()[-1]
+        assert entry['level'] == 'ERROR'
+        assert entry['message'] == "Sync failed for E:"
+        assert 'ValueError: bad drive' in entry['exception']
+
+    def test_records_written_by_queue_listener(self):
+        """Test that records go through the queue and reach the file on stop."""
+        logger = self.manager.setup_logging(self.temp_dir)
+        assert isinstance(logger.handlers[0], _RecordQueueHandler)
+
+        for i in range(3):
+            logger.warning("Sync %d", i)
+
+        messages = [entry['message'] for entry in self._read_entries()]
+        assert messages[-3:] == ["Sync 0", "Sync 1", "Sync 2"]
+
+    def test_setup_twice_replaces_listener(self):
+        """Test that re-initializing logging stops the previous listener."""
+        self.manager.setup_logging(self.temp_dir)
+        first_listener = self.manager._listener
+
+        self.manager.setup_logging(self.temp_dir)
+
+        assert self.manager._listener is not first_listener
+        assert first_listener._thread is None
+
+    def test_setup_recreates_removed_log_dir(self):
+        """Test that setting up again works after the log directory was deleted."""
+        self.manager.setup_logging(self.temp_dir)
+        self.manager.stop_logging()
+        shutil.rmtree(self.temp_dir)
+
+        logger = self.manager.setup_logging(self.temp_dir)
+        logger.warning("Back again")
+
+        assert self._read_entries()[-1]['message'] == "Back again"
+
+    def test_auto_color_respects_no_color(self):
+        """Test that auto mode disables colors when NO_COLOR is set."""
+        with patch.object(sys, 'stdout') as mock_stdout:
+            mock_stdout.isatty.return_value = True
+            with patch.dict(os.environ, {'NO_COLOR': '1'}):
+                assert not self.manager._use_color()
+            with patch.dict(os.environ):
+                os.environ.pop('NO_COLOR', None)
+                assert self.manager._use_color()
+
+    def test_auto_color_off_without_tty(self):
+        """Test that auto mode disables colors when stdout is not a terminal."""
+        with patch.object(sys, 'stdout') as mock_stdout, patch.dict(os.environ):
+            os.environ.pop('NO_COLOR', None)
+            mock_stdout.isatty.return_value = False
+            assert not self.manager._use_color()
+
+    def test_explicit_color_setting(self):
+        """Test that true/false color settings override detection."""
+        with patch.dict(os.environ, {'NO_COLOR': '1'}):
+            assert LoggingManager('c', {'logging': {'color': True}})._use_color()
+        assert not LoggingManager('c', {'logging': {'color': False}})._use_color()
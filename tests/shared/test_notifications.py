@@ -0,0 +1,425 @@
+"""
+Unit tests for the notification system.
+"""
+
+import asyncio
+import os
+import smtplib
+import socket
+import subprocess
+import sys
+import textwrap
+import threading
+import pytest
+from unittest.mock import patch, MagicMock
+
+from shared.notifications import (
+    NotificationManager, NotificationPreferences, Notification,
+    NotificationType, NotificationPriority, EmailNotifier
+)
+from shared.notifications.email_notifier import _PipeliningSMTP
+
+
+SMTP_CLASS = 'shared.notifications.email_notifier._PipeliningSMTP'
+
+
+EMAIL_CONFIG = {
+    'username': 'efis@example.com',
+    'password': 'secret',
+    'to_email': 'pilot@example.com'
+}
+
+
+class TestNotificationPreferences:
+    """Test cases for NotificationPreferences."""
+
+    def test_filter_types_stored_as_set(self):
+        """Test that excluded types are converted to a frozenset."""
+        preferences = NotificationPreferences(filter_types=[NotificationType.INFO])
+
+        assert preferences.filter_types == frozenset({NotificationType.INFO})
+        assert not preferences.should_notify_desktop(Notification(title="t", message="m"))
+
+    def test_quiet_hours_reparsed_on_change(self):
+        """Test that quiet hours are cached until the settings change."""
+        preferences = NotificationPreferences(quiet_hours_start="00:00", quiet_hours_end="23:59")
+
+        assert preferences._get_quiet_hours() is preferences._get_quiet_hours()
+
+        preferences.quiet_hours_end = None
+        assert preferences._get_quiet_hours() is None
+        assert not preferences._is_quiet_hours()
+
+
+class TestEmailNotifier:
+    """Test cases for EmailNotifier."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.notifier = EmailNotifier(dict(EMAIL_CONFIG))
+
+    def test_create_message_content(self):
+        """Test rendering of text and HTML email bodies."""
+        notification = Notification(
+            title="Sync failed",
+            message="Drive not mounted",
+            notification_type=NotificationType.ERROR,
+            operation="sync",
+            details={'drive': 'E:'}
+        )
+
+        text = self.notifier._create_text_content(notification)
+        html = self.notifier._create_html_content(notification)
+
+        assert "Title: Sync failed" in text
+        assert "Operation: sync" in text
+        assert "  drive: E:" in text
+        assert EmailNotifier.COLOR_MAP[NotificationType.ERROR] in html
+        assert "<strong>drive:</strong> E:" in html
+
+    def test_html_content_is_escaped(self):
+        """Test that notification text cannot inject markup into HTML emails."""
+        notification = Notification(
+            title="<b>Alert</b>",
+            message="Size < 5 & > 2",
+            details={'<key>': '<script>'}
+        )
+
+        html = self.notifier._create_html_content(notification)
+
+        assert "&lt;b&gt;Alert&lt;/b&gt;" in html
+        assert "Size &lt; 5 &amp; &gt; 2" in html
+        assert "<script>" not in html
+
+    def test_create_message_multipart(self):
+        """Test that detailed messages carry text and HTML alternatives."""
+        msg = self.notifier._create_message(
+            Notification(title="t", message="m", details={'drive': 'E:'})
+        )
+
+        assert msg.get_content_type() == 'multipart/alternative'
+        assert msg['Subject'] == "[EFIS Data Manager] t"
+
+    def test_short_message_sent_as_text(self):
+        """Test that short notifications skip the HTML part unless forced."""
+        notification = Notification(title="t", message="m")
+
+        assert self.notifier._create_message(notification).get_content_type() == 'text/plain'
+
+        forced = EmailNotifier(dict(EMAIL_CONFIG, force_html=True))
+        assert forced._create_message(notification).get_content_type() == 'multipart/alternative'
+
+    def test_create_message_text_only(self):
+        """Test that disabling HTML produces a single text/plain message."""
+        notifier = EmailNotifier(dict(EMAIL_CONFIG, html=False))
+        msg = notifier._create_message(Notification(title="t", message="m"))
+
+        assert msg.get_content_type() == 'text/plain'
+        assert not msg.is_multipart()
+
+    def test_send_many_uses_single_session(self):
+        """Test that a batch is delivered over one SMTP connection."""
+        notifications = [Notification(title=f"n{i}", message="m") for i in range(3)]
+
+        with patch(SMTP_CLASS) as mock_smtp:
+            sent = self.notifier.send_many(notifications)
+
+        server = mock_smtp.return_value.__enter__.return_value
+        assert sent == 3
+        assert mock_smtp.call_count == 1
+        assert server.login.call_count == 1
+        assert server.send_message.call_count == 3
+
+    def test_send_many_skips_refused_recipients(self):
+        """Test that a refused recipient does not abort the batch."""
+        notifications = [Notification(title=f"n{i}", message="m") for i in range(3)]
+
+        with patch(SMTP_CLASS) as mock_smtp:
+            server = mock_smtp.return_value.__enter__.return_value
+            server.send_message.side_effect = [
+                None,
+                smtplib.SMTPRecipientsRefused({'pilot@example.com': (550, b'no')}),
+                None
+            ]
+            sent = self.notifier.send_many(notifications)
+
+        assert sent == 2
+
+    def test_send_many_incomplete_config(self):
+        """Test that nothing is sent without credentials."""
+        notifier = EmailNotifier()
+
+        with patch(SMTP_CLASS) as mock_smtp:
+            assert notifier.send_many([Notification(title="t", message="m")]) == 0
+
+        mock_smtp.assert_not_called()
+
+
+class FakeSMTPServer(threading.Thread):
+    """Single-connection SMTP server on localhost that records what it receives."""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.listener = socket.create_server(('127.0.0.1', 0))
+        self.port = self.listener.getsockname()[1]
+        self.commands = []
+        self.data = None
+
+    def run(self):
+        conn, _ = self.listener.accept()
+        self.listener.close()
+        with conn, conn.makefile('rb') as rfile:
+            conn.sendall(b'220 fake ESMTP\r\n')
+            for line in rfile:
+                command = line.rstrip(b'\r\n').decode()
+                self.commands.append(command)
+                verb = command.split(':', 1)[0].split(' ', 1)[0].upper()
+                if verb == 'EHLO':
+                    conn.sendall(b'250-fake\r\n250 PIPELINING\r\n')
+                elif verb == 'DATA':
+                    conn.sendall(b'354 go ahead\r\n')
+                    self.data = self._read_data(rfile)
+                    conn.sendall(b'250 queued\r\n')
+                elif verb == 'QUIT':
+                    conn.sendall(b'221 bye\r\n')
+                    break
+                else:
+                    conn.sendall(b'250 ok\r\n')
+
+    @staticmethod
+    def _read_data(rfile):
+        """Read message data up to the end marker, as sent on the wire."""
+        lines = []
+        for line in rfile:
+            if line == b'.\r\n':
+                break
+            lines.append(line)
+        return b''.join(lines)
+
+
+class TestPipeliningSMTP:
+    """Test cases for the pipelining SMTP client."""
+
+    def setup_method(self):
+        """Set up an unconnected client advertising PIPELINING."""
+        self.server = _PipeliningSMTP()
+        self.server.ehlo_resp = b'ok'
+        self.server.does_esmtp = True
+        self.server.esmtp_features = {'pipelining': ''}
+
+    def test_envelope_sent_as_one_group(self):
+        """Test that MAIL, RCPT and DATA are written in a single send."""
+        with patch.object(self.server, 'send') as mock_send, \
+             patch.object(self.server, 'getreply') as mock_reply:
+            mock_reply.side_effect = [
+                (250, b'ok'), (250, b'ok'), (354, b'go ahead'), (250, b'queued')
+            ]
+            errors = self.server.sendmail('a@example.com', ['b@example.com'], 'Hi\n')
+
+        assert errors == {}
+        assert mock_send.call_count == 2
+        envelope = mock_send.call_args_list[0].args[0]
+        assert envelope == "MAIL FROM:<a@example.com>\r\nRCPT TO:<b@example.com>\r\nDATA\r\n"
+        assert mock_send.call_args_list[1].args[0] == b"Hi\r\n.\r\n"
+
+    def test_all_recipients_refused(self):
+        """Test that refused recipients raise after draining every reply."""
+        with patch.object(self.server, 'send'), \
+             patch.object(self.server, 'getreply') as mock_reply, \
+             patch.object(self.server, 'rset') as mock_rset:
+            mock_reply.side_effect = [(250, b'ok'), (550, b'no such user'), (554, b'no valid recipients')]
+            with pytest.raises(smtplib.SMTPRecipientsRefused):
+                self.server.sendmail('a@example.com', ['b@example.com'], 'Hi')
+
+        assert mock_reply.call_count == 3
+        mock_rset.assert_called_once()
+
+    def test_abort_after_disconnect(self):
+        """Test that a dropped connection during the reset still raises the refusal."""
+        with patch.object(self.server, 'send'), \
+             patch.object(self.server, 'getreply') as mock_reply, \
+             patch.object(self.server, 'rset', side_effect=smtplib.SMTPServerDisconnected):
+            mock_reply.side_effect = [(550, b'sender rejected'), (250, b'ok'), (503, b'no mail')]
+            with pytest.raises(smtplib.SMTPSenderRefused):
+                self.server.sendmail('a@example.com', ['b@example.com'], 'Hi')
+
+    def test_data_on_the_wire(self):
+        """Test line endings and dot-stuffing of a message sent to a real socket."""
+        fake_server = FakeSMTPServer()
+        fake_server.start()
+
+        with _PipeliningSMTP('127.0.0.1', fake_server.port, timeout=5) as client:
+            errors = client.sendmail(
+                'a@example.com', ['b@example.com'], 'Subject: hi\n\n.hidden\r\nmid\rlast'
+            )
+        fake_server.join(5)
+
+        assert errors == {}
+        assert fake_server.commands[1:4] == [
+            'MAIL FROM:<a@example.com>', 'RCPT TO:<b@example.com>', 'DATA'
+        ]
+        assert fake_server.data == b'Subject: hi\r\n\r\n..hidden\r\nmid\r\nlast\r\n'
+        assert fake_server.commands[-1] == 'QUIT'
+
+
+class TestNotificationManager:
+    """Test cases for NotificationManager."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        preferences = NotificationPreferences(
+            enable_desktop=False,
+            enable_email=True,
+            email_address='pilot@example.com'
+        )
+        self.manager = NotificationManager(preferences)
+        self.manager.email_notifier.update_config(dict(EMAIL_CONFIG))
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.manager.close()
+
+    def test_email_notifications_are_batched(self):
+        """Test that queued emails share a single SMTP session."""
+        with patch(SMTP_CLASS) as mock_smtp:
+            for i in range(5):
+                assert self.manager.notify_error(f"Error {i}", "Something failed")
+            self.manager.stop_email_worker()
+
+        server = mock_smtp.return_value.__enter__.return_value
+        assert mock_smtp.call_count == 1
+        assert server.send_message.call_count == 5
+
+    def test_duplicate_notifications_suppressed(self):
+        """Test that identical notifications within the window are sent once."""
+        with patch(SMTP_CLASS) as mock_smtp:
+            for _ in range(3):
+                assert self.manager.notify_error("Sync failed", "Drive not mounted")
+            self.manager.stop_email_worker()
+
+        server = mock_smtp.return_value.__enter__.return_value
+        assert server.send_message.call_count == 1
+
+    def test_duplicate_window_expires(self):
+        """Test that a notification is resent once the window has passed."""
+        self.manager.DEDUPE_WINDOW = 0.0
+
+        with patch(SMTP_CLASS) as mock_smtp:
+            assert self.manager.notify_error("Sync failed", "Drive not mounted")
+            assert self.manager.notify_error("Sync failed", "Drive not mounted")
+            self.manager.stop_email_worker()
+
+        server = mock_smtp.return_value.__enter__.return_value
+        assert server.send_message.call_count == 2
+
+    def test_close_drains_email_queue(self):
+        """Test that close() sends queued emails without stopping the worker first."""
+        with patch(SMTP_CLASS) as mock_smtp:
+            assert self.manager.notify_error("Shutdown", "Drive unmounted")
+            self.manager.close()
+
+        server = mock_smtp.return_value.__enter__.return_value
+        assert server.send_message.call_count == 1
+
+    def test_queued_email_sent_at_interpreter_exit(self):
+        """Test that a process exiting right after notify() still sends its email."""
+        script = textwrap.dedent(f"""
+            from unittest.mock import patch
+            from shared.notifications import NotificationManager, NotificationPreferences
+
+            manager = NotificationManager(NotificationPreferences(
+                enable_desktop=False, enable_email=True, email_address='pilot@example.com'
+            ))
+            manager.email_notifier.update_config({EMAIL_CONFIG!r})
+            patch({SMTP_CLASS!r}).start()
+            patch.object(manager.email_notifier, 'send_many',
+                         side_effect=lambda batch: print('sent', len(batch)) or len(batch)).start()
+            manager.notify_error("Sync failed", "Drive not mounted")
+        """)
+        repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+            filter(None, (repo_root, os.environ.get('PYTHONPATH')))
+        ))
+
+        result = subprocess.run(
+            [sys.executable, '-c', script], cwd=repo_root, env=env,
+            capture_output=True, text=True, timeout=30
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == 'sent 1'
+
+    def test_filtered_type_not_recorded(self):
+        """Test that filtered notifications skip dispatch and duplicate tracking."""
+        self.manager.preferences.filter_types = frozenset({NotificationType.ERROR})
+
+        assert self.manager.notify_error("Sync failed", "Drive not mounted")
+        assert not self.manager._recent
+        assert self.manager._email_queue.empty()
+
+    def test_low_priority_email_not_queued(self):
+        """Test that notifications below the email threshold are not queued."""
+        with patch(SMTP_CLASS) as mock_smtp:
+            assert self.manager.notify_info("Info", "Nothing to see")
+            self.manager.stop_email_worker()
+
+        mock_smtp.assert_not_called()
+
+    def test_anotify(self):
+        """Test sending a notification from async code."""
+        with patch(SMTP_CLASS) as mock_smtp:
+            assert asyncio.run(self.manager.anotify(
+                Notification(title="Async", message="m", priority=NotificationPriority.URGENT)
+            ))
+            self.manager.stop_email_worker()
+
+        server = mock_smtp.return_value.__enter__.return_value
+        assert server.send_message.call_count == 1
+
+    def test_powershell_host_is_reused(self):
+        """Test that PowerShell toasts share one long-lived host process."""
+        def fake_host(*args, **kwargs):
+            host = MagicMock()
+            host.poll.return_value = None
+            host.stdout = iter(["__EFIS_DONE__OK\n"] * 2)
+            return host
+
+        notification = Notification(title="Line 1\nLine 2", message="It's done")
+
+        with patch('subprocess.Popen', side_effect=fake_host) as mock_popen:
+            assert self.manager._send_windows_powershell_notification(notification)
+            assert self.manager._send_windows_powershell_notification(notification)
+
+        assert mock_popen.call_count == 1
+        script = self.manager._ps.stdin.write.call_args.args[0]
+        assert script.count("\n") == 1
+        assert "It''s done" in script
+
+    def test_windows_runtime_preferred_over_powershell(self):
+        """Test that winsdk toasts are used in-process when available."""
+        module = 'shared.notifications.notification_manager'
+
+        with patch(f'{module}.WIN10TOAST_AVAILABLE', False), \
+             patch(f'{module}.WINSDK_AVAILABLE', True), \
+             patch(f'{module}.xml_dom'), \
+             patch(f'{module}.win_notifications') as win_notifications, \
+             patch('subprocess.Popen') as mock_popen:
+            assert self.manager._send_windows_notification(Notification(title="t", message="m"))
+            assert self.manager._send_windows_notification(Notification(title="t", message="m"))
+
+        mock_popen.assert_not_called()
+        create_notifier = win_notifications.ToastNotificationManager.create_toast_notifier
+        create_notifier.assert_called_once()
+        assert create_notifier.return_value.show.call_count == 2
+
+    def test_macos_notification_passes_text_as_arguments(self):
+        """Test that notification text never becomes AppleScript source."""
+        notification = Notification(title='Say "hi"', message='Line 1\nLine "2"')
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value.returncode = 0
+            assert self.manager._send_macos_notification(notification)
+
+        command = mock_run.call_args.args[0]
+        assert command[-3:] == ['Line 1\nLine "2"', 'Say "hi"', "Blow"]
+        assert not any('Say' in part for part in command[:-3])
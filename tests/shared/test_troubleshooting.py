@@ -0,0 +1,228 @@
+"""
+Unit tests for the troubleshooting helpers.
+"""
+
+import os
+import shutil
+import socket
+import tempfile
+import time
+from unittest.mock import patch
+
+import pytest
+
+from shared.utils import troubleshooting
+from shared.utils.troubleshooting import (
+    SystemDiagnostics, _read_tail_lines, _classify_log_line, _parse_config_file, _ttl_cache
+)
+
+
+class TestLogHelpers:
+    """Test cases for log tail reading and line classification."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, 'efis.log')
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, data):
+        """Replace the log file's contents."""
+        with open(self.log_file, 'wb') as f:
+            f.write(data)
+
+    def test_read_tail_lines_across_blocks(self):
+        """Test that the last lines are found when they span several blocks."""
+        self._write(b''.join(b'line %d\n' % i for i in range(100)))
+
+        lines = _read_tail_lines(self.log_file, 5, block_size=16)
+
+        assert lines == [b'line %d' % i for i in range(95, 100)]
+
+    def test_read_tail_lines_short_file(self):
+        """Test that a file shorter than the limit is returned whole."""
+        self._write(b'first\nsecond')
+
+        assert _read_tail_lines(self.log_file, 10) == [b'first', b'second']
+
+    def test_read_tail_lines_empty_file(self):
+        """Test that an empty file yields no lines."""
+        self._write(b'')
+
+        assert _read_tail_lines(self.log_file, 10) == []
+
+    @pytest.mark.parametrize("line, expected", [
+        (b'2024-01-01 - INFO - Sync complete', None),
+        (b'2024-01-01 - WARNING - Disk almost full', 'warning'),
+        (b'2024-01-01 - ERROR - Mount failed', 'error'),
+        (b'warning: retrying after error', 'error'),
+        (b'Error: drive missing', 'error'),
+        (b'', None),
+    ])
+    def test_classify_log_line(self, line, expected):
+        """Test keyword classification, with errors taking precedence."""
+        assert _classify_log_line(line) == expected
+
+
+class TestParseConfigFile:
+    """Test cases for the mtime-keyed config parser."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.temp_dir, 'config.json')
+        _parse_config_file.cache_clear()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        _parse_config_file.cache_clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, text):
+        """Replace the config file's contents."""
+        with open(self.config_file, 'w') as f:
+            f.write(text)
+
+    def test_reports_invalid_json(self):
+        """Test that a parse error message is returned for broken files."""
+        self._write('{"syncInterval": }')
+
+        assert _parse_config_file(self.config_file, 1) is not None
+
+    def test_result_keyed_on_mtime(self):
+        """Test that a file is only re-parsed when its mtime changes."""
+        self._write('{"syncInterval": 1800}')
+        assert _parse_config_file(self.config_file, 1) is None
+
+        self._write('not json')
+        assert _parse_config_file(self.config_file, 1) is None
+        assert _parse_config_file(self.config_file, 2) is not None
+
+
+class TestTTLCache:
+    """Test cases for the per-instance TTL cache decorator."""
+
+    class Sections:
+        """Minimal host for _ttl_cache with a call counter."""
+
+        def __init__(self):
+            self._section_cache = {}
+            self.calls = 0
+
+        @_ttl_cache(60)
+        def report(self):
+            """Return a fresh report, counting each computation."""
+            self.calls += 1
+            return {'drives': ['E:'], 'call': self.calls}
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.sections = self.Sections()
+
+    def test_cached_within_ttl(self):
+        """Test that repeated calls inside the TTL reuse the result."""
+        with patch.object(troubleshooting.time, 'monotonic', side_effect=[100.0, 130.0]):
+            first = self.sections.report()
+            second = self.sections.report()
+
+        assert first == second
+        assert self.sections.calls == 1
+
+    def test_recomputed_after_ttl(self):
+        """Test that results expire once the TTL has passed."""
+        with patch.object(troubleshooting.time, 'monotonic', side_effect=[100.0, 161.0]):
+            self.sections.report()
+            assert self.sections.report()['call'] == 2
+
+    def test_returns_independent_copies(self):
+        """Test that mutating a returned result does not change the cache."""
+        self.sections.report()['drives'].append('F:')
+
+        assert self.sections.report()['drives'] == ['E:']
+
+    def test_clear_cache(self):
+        """Test that SystemDiagnostics.clear_cache() forces recomputation."""
+        diagnostics = SystemDiagnostics()
+        diagnostics._check_required_modules()
+        assert diagnostics._section_cache
+
+        diagnostics.clear_cache()
+
+        assert not diagnostics._section_cache
+
+    def test_module_check_rechecked_after_clear(self):
+        """Test that a module installed while running is found once the cache clears."""
+        diagnostics = SystemDiagnostics()
+        with patch.object(troubleshooting, 'find_spec', return_value=None):
+            assert not any(diagnostics._check_required_modules().values())
+
+        diagnostics.clear_cache()
+        assert all(diagnostics._check_required_modules().values())
+
+
+class TestProbeHosts:
+    """Test cases for the TCP connectivity probe."""
+
+    def setup_method(self):
+        """Set up a listening socket and a port with nothing behind it."""
+        self.diagnostics = SystemDiagnostics()
+        self.listener = socket.create_server(('127.0.0.1', 0))
+        self.open_port = self.listener.getsockname()[1]
+        with socket.create_server(('127.0.0.1', 0)) as closed:
+            self.closed_port = closed.getsockname()[1]
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        self.listener.close()
+
+    def _address(self, port):
+        """Build a getaddrinfo() entry for a local port."""
+        return (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, '', ('127.0.0.1', port))
+
+    def test_reachable_and_refused(self):
+        """Test that open and closed ports are reported in configured order."""
+        result = self.diagnostics._probe_hosts(
+            (('127.0.0.1', self.closed_port), ('localhost', self.open_port))
+        )
+
+        assert list(result) == ['127.0.0.1', 'localhost']
+        assert result['127.0.0.1']['reachable'] is False
+        assert result['localhost'] == {'reachable': True, 'response_time': 'success'}
+
+    def test_falls_back_to_next_address(self):
+        """Test that a refused first address does not hide a working one."""
+        addresses = [self._address(self.closed_port), self._address(self.open_port)]
+
+        with patch.object(troubleshooting.socket, 'getaddrinfo', return_value=addresses):
+            result = self.diagnostics._probe_hosts((('efis.example', 443),))
+
+        assert result['efis.example']['reachable'] is True
+
+    def test_slow_lookup_bounded_by_timeout(self):
+        """Test that a hanging name lookup times out without delaying other hosts."""
+        def getaddrinfo(host, port, **kwargs):
+            if host == 'slow.example':
+                time.sleep(2)
+            return [self._address(self.open_port)]
+
+        started = time.monotonic()
+        with patch.object(troubleshooting.socket, 'getaddrinfo', side_effect=getaddrinfo):
+            result = self.diagnostics._probe_hosts(
+                (('slow.example', 443), ('fast.example', 443)), timeout=0.3
+            )
+
+        assert time.monotonic() - started < 1.5
+        assert result['slow.example'] == {'reachable': False, 'response_time': 'timeout'}
+        assert result['fast.example']['reachable'] is True
+
+    def test_lookup_failure(self):
+        """Test that a failed name lookup is reported with its error."""
+        with patch.object(troubleshooting.socket, 'getaddrinfo',
+                          side_effect=socket.gaierror('Name or service not known')):
+            result = self.diagnostics._probe_hosts((('missing.example', 443),))
+
+        assert result['missing.example']['reachable'] is False
+        assert 'Name or service not known' in result['missing.example']['error']